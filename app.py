@@ -4,13 +4,60 @@ Fantasy Football Playoff Scenario Analyzer - Web Application
 Supports multiple leagues: WFFL, DFFL, FFPL
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, request
+from flask_compress import Compress
+import brotli
+import hashlib
 import json
-import copy
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 import os
+import sys
+import numpy as np
+import orjson
 
 app = Flask(__name__)
+app.json.compact = True
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+Compress(app)
+if not app.debug:
+    # Templates only change with a deploy; skip the per-render mtime check
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
+
+
+def _dumps(obj):
+    """Serialize to JSON bytes with orjson; NumPy values pass straight through."""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _json(obj):
+    """JSON response serialized with orjson."""
+    return _json_bytes(_dumps(obj))
+
+
+def _json_bytes(payload, payload_br=None):
+    """
+    JSON response for an already serialized payload. If a brotli-compressed
+    copy is given and the client accepts br, that is sent as is; otherwise
+    Compress encodes the body per request.
+    """
+    if payload_br is not None and request.accept_encodings['br']:
+        response = app.response_class(payload_br, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'br'
+        response.vary.add('Accept-Encoding')
+        return response
+    return app.response_class(payload, mimetype='application/json')
+
+
+def _brotli(payload):
+    """Brotli-compress a payload that is cached for the life of the process."""
+    return brotli.compress(payload, quality=11)
 
 # Load all leagues data
 with open('all_leagues_data.json') as f:
@@ -28,6 +75,42 @@ if os.path.exists('team_summaries.json'):
     with open('team_summaries.json') as f:
         TEAM_SUMMARIES = json.load(f)
 
+# Intern team names so the many team-keyed lookups (stats, h2h, divisions)
+# compare keys by identity
+for _league in ALL_LEAGUES.values():
+    _league['teams'] = [sys.intern(_team) for _team in _league['teams']]
+    _league['divisions'] = {
+        _div: [sys.intern(_team) for _team in _div_teams] for _div, _div_teams in _league['divisions'].items()
+    }
+    _league['stats'] = {sys.intern(_team): _team_stats for _team, _team_stats in _league['stats'].items()}
+    for _team_stats in _league['stats'].values():
+        _team_stats['h2h'] = {sys.intern(_opp): _h2h for _opp, _h2h in _team_stats['h2h'].items()}
+    for _m in _league['week14_matchups']:
+        _m['away_team'] = sys.intern(_m['away_team'])
+        _m['home_team'] = sys.intern(_m['home_team'])
+
+# Make sure every team has an h2h entry for every opponent so Week 14
+# results and tiebreak lookups can index h2h directly
+for _league in ALL_LEAGUES.values():
+    for _team in _league['teams']:
+        for _opp in _league['teams']:
+            if _opp != _team:
+                _league['stats'][_team]['h2h'].setdefault(
+                    _opp, {'wins': 0, 'losses': 0, 'ties': 0, 'points_for': 0, 'points_against': 0}
+                )
+
+# "W-L" display string per team; the responses read it instead of formatting
+# the record on every request
+for _league in ALL_LEAGUES.values():
+    for _team_stats in _league['stats'].values():
+        _team_stats['record_str'] = f"{_team_stats['wins']}-{_team_stats['losses']}"
+
+
+# Fixed-schema views of a team's stats row and an h2h cell as plain tuples;
+# one C-level call per row instead of a subscript per field
+_RECORD = itemgetter('wins', 'losses', 'ties')
+_FULL_RECORD = itemgetter('wins', 'losses', 'ties', 'division_wins', 'division_losses', 'division_ties')
+
 
 def get_team_division(team, divisions):
     for div, teams in divisions.items():
@@ -36,6 +119,32 @@ def get_team_division(team, divisions):
     return None
 
 
+def build_team_division_map(divisions):
+    """Reverse {division: [teams]} into {team: division} for O(1) lookups."""
+    return {team: div for div, div_teams in divisions.items() for team in div_teams}
+
+
+TEAM_DIVISION = {
+    league_name: build_team_division_map(league_info['divisions'])
+    for league_name, league_info in ALL_LEAGUES.items()
+}
+
+
+def build_matchup_game_ids(matchups):
+    """[(away, home, is_division_game, game_id)] for a list of matchups."""
+    return [
+        (m['away_team'], m['home_team'], m['is_division_game'],
+         f"{m['away_team']}_at_{m['home_team']}".replace("'", "").replace(" ", "_"))
+        for m in matchups
+    ]
+
+
+MATCHUP_GAME_IDS = {
+    league_name: build_matchup_game_ids(league_info['week14_matchups'])
+    for league_name, league_info in ALL_LEAGUES.items()
+}
+
+
 def calculate_win_pct(wins, losses, ties=0):
     total = wins + losses + ties
     if total == 0:
@@ -44,29 +153,62 @@ def calculate_win_pct(wins, losses, ties=0):
 
 
 def get_h2h_record(stats, team1, team2):
-    h2h = stats[team1]['h2h'].get(team2, {'wins': 0, 'losses': 0, 'ties': 0})
+    h2h = stats[team1]['h2h'][team2]
     return h2h['wins'], h2h['losses'], h2h['ties']
 
 
 def get_h2h_record_vs_group(stats, team, opponents):
     wins = losses = ties = 0
+    team_h2h = stats[team]['h2h']
     for opp in opponents:
         if opp != team:
-            h2h = stats[team]['h2h'].get(opp, {'wins': 0, 'losses': 0, 'ties': 0})
+            h2h = team_h2h[opp]
             wins += h2h['wins']
             losses += h2h['losses']
             ties += h2h['ties']
     return wins, losses, ties
 
 
+# An h2h (wins, losses, ties) cell packed into one int, 16 bits per field, so a
+# record against a group is a single integer sum. No count comes near 2**16.
+_H2H_FIELD_BITS = 16
+_H2H_FIELD_MASK = (1 << _H2H_FIELD_BITS) - 1
+
+
+def _pack_h2h(h2h):
+    return h2h['wins'] | (h2h['losses'] << _H2H_FIELD_BITS) | (h2h['ties'] << (2 * _H2H_FIELD_BITS))
+
+
+def _unpack_h2h(packed):
+    return (packed & _H2H_FIELD_MASK,
+            (packed >> _H2H_FIELD_BITS) & _H2H_FIELD_MASK,
+            packed >> (2 * _H2H_FIELD_BITS))
+
+
+def _get_packed_h2h_row(stats, derived, team):
+    """{opp: packed h2h} for a team, built on first use per set of standings."""
+    packed = derived['h2h_packed']
+    row = packed.get(team)
+    if row is None:
+        row = packed[team] = {opp: _pack_h2h(h2h) for opp, h2h in stats[team]['h2h'].items()}
+    return row
+
+
+def _get_h2h_record_vs_group(stats, derived, team, opponents):
+    """get_h2h_record_vs_group using the team's packed h2h row."""
+    row = _get_packed_h2h_row(stats, derived, team)
+    return _unpack_h2h(sum(row[opp] for opp in opponents if opp != team))
+
+
 def calculate_strength_of_schedule(stats, team, teams):
     total_opp_wins = 0
     total_opp_losses = 0
     total_opp_ties = 0
+    team_h2h = stats[team]['h2h']
     
     for opp in teams:
         if opp != team:
-            h2h = stats[team]['h2h'].get(opp, {'wins': 0, 'losses': 0, 'ties': 0})
+            h2h = team_h2h[opp]
             games_vs_opp = h2h['wins'] + h2h['losses'] + h2h['ties']
             
             if games_vs_opp > 0:
@@ -78,15 +220,64 @@ def calculate_strength_of_schedule(stats, team, teams):
     return calculate_win_pct(total_opp_wins, total_opp_losses, total_opp_ties)
 
 
-def break_tie_division(stats, tied_teams, divisions, h2h_points_override=None):
+def build_games_matrix(stats, teams):
+    """Games played between each pair of teams, as a (T, T) array in `teams` order."""
+    index = {team: i for i, team in enumerate(teams)}
+    games = np.zeros((len(teams), len(teams)), dtype=np.int64)
+    for team in teams:
+        for opp, h2h in stats[team]['h2h'].items():
+            if opp in index:
+                games[index[team], index[opp]] = h2h['wins'] + h2h['losses'] + h2h['ties']
+    return games
+
+
+def build_tiebreak_stats(stats, teams, games_matrix=None):
+    """
+    Precompute the per-team values the tiebreakers compare, once per set of standings.
+    Strength of schedule is only needed for some wild card ties, so it is filled in
+    for every team on first use by _get_strength_of_schedule; packed h2h rows are
+    likewise built per team on first use.
+    """
+    return {
+        'teams': teams,
+        'games': games_matrix,
+        'div_pct': {
+            t: calculate_win_pct(stats[t]['division_wins'], stats[t]['division_losses'], stats[t]['division_ties'])
+            for t in teams
+        },
+        'records': {t: _RECORD(stats[t]) for t in teams},
+        'points_for': {t: stats[t]['points_for'] for t in teams},
+        'matrix_rank': {t: stats[t]['matrix_rank'] for t in teams},
+        'sos': {},
+        'h2h_packed': {},
+    }
+
+
+def _get_strength_of_schedule(stats, derived, team):
+    sos = derived['sos']
+    if not sos:
+        # Opponents' combined record for every team at once: games[t, o] * record[o]
+        teams = derived['teams']
+        games = derived['games']
+        if games is None:
+            games = derived['games'] = build_games_matrix(stats, teams)
+        records = np.array([_RECORD(stats[t]) for t in teams], dtype=np.int64)
+        for t, (opp_wins, opp_losses, opp_ties) in zip(teams, (games @ records).tolist()):
+            sos[t] = calculate_win_pct(opp_wins, opp_losses, opp_ties)
+    return sos[team]
+
+
+def break_tie_division(stats, tied_teams, divisions, h2h_points_override=None, derived=None):
     if len(tied_teams) == 1:
         return tied_teams
+    if derived is None:
+        derived = build_tiebreak_stats(stats, tied_teams)
     if len(tied_teams) == 2:
-        return _break_tie_division_two(stats, tied_teams, h2h_points_override)
-    return _break_tie_division_multi(stats, tied_teams, divisions, h2h_points_override)
+        return _break_tie_division_two(stats, tied_teams, h2h_points_override, derived)
+    return _break_tie_division_multi(stats, tied_teams, divisions, h2h_points_override, derived)
 
 
-def get_lowest_in_division_for_relegation(stats, div_teams):
+def get_lowest_in_division_for_relegation(stats, div_teams, derived=None):
     """
     Order teams within a division using Division Tie Breaker rules.
     Returns teams ordered from BEST (1st) to WORST (4th).
@@ -104,57 +295,37 @@ def get_lowest_in_division_for_relegation(stats, div_teams):
     if len(div_teams) == 2:
         t1, t2 = div_teams
         
-        # 1. H2H Record
-        w1, l1, _ = get_h2h_record(stats, t1, t2)
-        w2, l2, _ = get_h2h_record(stats, t2, t1)
-        if w1 > w2:
-            return [t1, t2]
-        elif w2 > w1:
-            return [t2, t1]
-        
-        # 2. Division Record
-        div1_pct = calculate_win_pct(stats[t1]['division_wins'], stats[t1]['division_losses'], stats[t1].get('division_ties', 0))
-        div2_pct = calculate_win_pct(stats[t2]['division_wins'], stats[t2]['division_losses'], stats[t2].get('division_ties', 0))
-        if div1_pct > div2_pct:
-            return [t1, t2]
-        elif div2_pct > div1_pct:
-            return [t2, t1]
-        
-        # 3. Total Points in H2H Games
-        h2h_pts1 = stats[t1]['h2h'].get(t2, {}).get('points_for', 0)
-        h2h_pts2 = stats[t2]['h2h'].get(t1, {}).get('points_for', 0)
-        if h2h_pts1 > h2h_pts2:
-            return [t1, t2]
-        elif h2h_pts2 > h2h_pts1:
-            return [t2, t1]
-        
-        # 4. Total Points in All Games
-        if stats[t1]['points_for'] > stats[t2]['points_for']:
-            return [t1, t2]
-        elif stats[t2]['points_for'] > stats[t1]['points_for']:
-            return [t2, t1]
+        # Rules 1-5 in order, then name; the first differing field decides
+        def key(team, opp):
+            s = stats[team]
+            return (
+                -s['h2h'][opp]['wins'],
+                -calculate_win_pct(s['division_wins'], s['division_losses'], s.get('division_ties', 0)),
+                -s['h2h'][opp]['points_for'],
+                -s['points_for'],
+                s.get('matrix_rank', 99),
+                team,
+            )
         
-        # 5. Matrix Rank
-        if stats[t1].get('matrix_rank', 99) < stats[t2].get('matrix_rank', 99):
-            return [t1, t2]
-        elif stats[t2].get('matrix_rank', 99) < stats[t1].get('matrix_rank', 99):
-            return [t2, t1]
-        
-        return sorted([t1, t2])
+        return [t1, t2] if key(t1, t2) < key(t2, t1) else [t2, t1]
+    
+    if derived is None:
+        derived = build_tiebreak_stats(stats, div_teams)
     
-    # For 3+ teams, use iterative approach
-    remaining = list(div_teams)
+    # For 3+ teams, use iterative approach. A dict serves as an ordered set
+    # so picked teams are dropped in O(1).
+    remaining = dict.fromkeys(div_teams)
     result = []
     
     while remaining:
         if len(remaining) == 1:
-            result.append(remaining[0])
+            result.extend(remaining)
             break
         
         # Find best using H2H among remaining
         h2h_records = {}
         for team in remaining:
-            w, l, t = get_h2h_record_vs_group(stats, team, remaining)
+            w, l, t = _get_h2h_record_vs_group(stats, derived, team, remaining)
             h2h_records[team] = calculate_win_pct(w, l, t)
         
         best_pct = max(h2h_records.values())
@@ -162,7 +333,7 @@ def get_lowest_in_division_for_relegation(stats, div_teams):
         
         if len(best_teams) == 1:
             result.append(best_teams[0])
-            remaining.remove(best_teams[0])
+            del remaining[best_teams[0]]
             continue
         
         # Tied on H2H, use division record
@@ -172,18 +343,18 @@ def get_lowest_in_division_for_relegation(stats, div_teams):
         
         if len(best_teams) == 1:
             result.append(best_teams[0])
-            remaining.remove(best_teams[0])
+            del remaining[best_teams[0]]
             continue
         
         # Tied on div record, use total points
         best = max(best_teams, key=lambda t: stats[t]['points_for'])
         result.append(best)
-        remaining.remove(best)
+        del remaining[best]
     
     return result
 
 
-def compare_cross_division_for_relegation(stats, candidates, all_teams, divisions):
+def compare_cross_division_for_relegation(stats, candidates, all_teams, divisions, derived=None):
     """
     Compare teams from different divisions using Wild Card Tie Breaker.
     Returns the BEST team (winner, should be safe).
@@ -197,38 +368,29 @@ def compare_cross_division_for_relegation(stats, candidates, all_teams, division
     if len(candidates) == 1:
         return candidates[0]
     
+    if derived is None:
+        derived = build_tiebreak_stats(stats, all_teams)
+    
     if len(candidates) == 2:
         t1, t2 = candidates
         
         # 1. H2H Record
         w1, l1, _ = get_h2h_record(stats, t1, t2)
         w2, l2, _ = get_h2h_record(stats, t2, t1)
-        if w1 > w2:
-            return t1
-        elif w2 > w1:
-            return t2
-        
-        # 2. Strength of Schedule
-        sos1 = calculate_strength_of_schedule(stats, t1, all_teams)
-        sos2 = calculate_strength_of_schedule(stats, t2, all_teams)
-        if sos1 > sos2:
-            return t1
-        elif sos2 > sos1:
-            return t2
+        if w1 != w2:
+            return t1 if w1 > w2 else t2
         
-        # 3. Total Points
-        if stats[t1]['points_for'] > stats[t2]['points_for']:
-            return t1
-        elif stats[t2]['points_for'] > stats[t1]['points_for']:
-            return t2
+        # 2-4 and then name in one comparison; strength of schedule is only
+        # computed once H2H is level
+        def key(team):
+            return (
+                -_get_strength_of_schedule(stats, derived, team),
+                -stats[team]['points_for'],
+                stats[team].get('matrix_rank', 99),
+                team,
+            )
         
-        # 4. Matrix Rank
-        if stats[t1].get('matrix_rank', 99) < stats[t2].get('matrix_rank', 99):
-            return t1
-        elif stats[t2].get('matrix_rank', 99) < stats[t1].get('matrix_rank', 99):
-            return t2
-        
-        return sorted(candidates)[0]
+        return t1 if key(t1) < key(t2) else t2
     
     # 3+ teams: use iterative H2H among group
     remaining = list(candidates)
@@ -236,7 +398,7 @@ def compare_cross_division_for_relegation(stats, candidates, all_teams, division
     # 1. H2H among group
     h2h_records = {}
     for team in remaining:
-        w, l, t = get_h2h_record_vs_group(stats, team, remaining)
+        w, l, t = _get_h2h_record_vs_group(stats, derived, team, remaining)
         h2h_records[team] = calculate_win_pct(w, l, t)
     
     best_pct = max(h2h_records.values())
@@ -246,7 +408,7 @@ def compare_cross_division_for_relegation(stats, candidates, all_teams, division
         return best_teams[0]
     
     # 2. Strength of Schedule
-    sos = {t: calculate_strength_of_schedule(stats, t, all_teams) for t in best_teams}
+    sos = {t: _get_strength_of_schedule(stats, derived, t) for t in best_teams}
     best_sos = max(sos.values())
     best_teams = [t for t in best_teams if sos[t] == best_sos]
     
@@ -258,200 +420,163 @@ def compare_cross_division_for_relegation(stats, candidates, all_teams, division
     return best
 
 
-def _break_tie_division_two(stats, tied_teams, h2h_points_override=None):
+def _break_tie_division_two(stats, tied_teams, h2h_points_override=None, derived=None):
     t1, t2 = tied_teams
+    if derived is None:
+        derived = build_tiebreak_stats(stats, tied_teams)
+    div_pct = derived['div_pct']
+    points_for = derived['points_for']
+    matrix_rank = derived['matrix_rank']
     
     w1, l1, _ = get_h2h_record(stats, t1, t2)
     w2, l2, _ = get_h2h_record(stats, t2, t1)
     
-    if w1 > w2:
-        return [t1, t2]
-    elif w2 > w1:
-        return [t2, t1]
-    
-    div1_pct = calculate_win_pct(stats[t1]['division_wins'], stats[t1]['division_losses'], stats[t1]['division_ties'])
-    div2_pct = calculate_win_pct(stats[t2]['division_wins'], stats[t2]['division_losses'], stats[t2]['division_ties'])
-    
-    if div1_pct > div2_pct:
-        return [t1, t2]
-    elif div2_pct > div1_pct:
-        return [t2, t1]
-    
     if h2h_points_override and (t1, t2) in h2h_points_override:
         h2h_pts1, h2h_pts2 = h2h_points_override[(t1, t2)]
     else:
-        h2h_pts1 = stats[t1]['h2h'].get(t2, {}).get('points_for', 0)
-        h2h_pts2 = stats[t2]['h2h'].get(t1, {}).get('points_for', 0)
-    
-    if h2h_pts1 > h2h_pts2:
-        return [t1, t2]
-    elif h2h_pts2 > h2h_pts1:
-        return [t2, t1]
-    
-    if stats[t1]['points_for'] > stats[t2]['points_for']:
-        return [t1, t2]
-    elif stats[t2]['points_for'] > stats[t1]['points_for']:
-        return [t2, t1]
-    
-    if stats[t1]['matrix_rank'] < stats[t2]['matrix_rank']:
-        return [t1, t2]
-    elif stats[t2]['matrix_rank'] < stats[t1]['matrix_rank']:
-        return [t2, t1]
-    
-    return sorted([t1, t2])
+        h2h_pts1 = stats[t1]['h2h'][t2]['points_for']
+        h2h_pts2 = stats[t2]['h2h'][t1]['points_for']
+    
+    # H2H wins, division pct, H2H points, points for, matrix rank, then name;
+    # the first differing field decides, exactly as the step-by-step ladder
+    key1 = (-w1, -div_pct[t1], -h2h_pts1, -points_for[t1], matrix_rank[t1], t1)
+    key2 = (-w2, -div_pct[t2], -h2h_pts2, -points_for[t2], matrix_rank[t2], t2)
+    return [t1, t2] if key1 < key2 else [t2, t1]
 
 
-def _break_tie_division_multi(stats, tied_teams, divisions, h2h_points_override=None):
-    remaining = list(tied_teams)
+def _break_tie_division_multi(stats, tied_teams, divisions, h2h_points_override=None, derived=None):
+    if derived is None:
+        derived = build_tiebreak_stats(stats, tied_teams)
+    div_pct = derived['div_pct']
+    points_for = derived['points_for']
+    matrix_rank = derived['matrix_rank']
+    
+    rows = {team: _get_packed_h2h_row(stats, derived, team) for team in tied_teams}
+    
+    def new_group(teams):
+        # Ordered {team: packed h2h record vs the rest of the group}
+        return {t: sum(rows[t][o] for o in teams if o != t) for t in teams}
+    
+    # Worklist of groups still to order, innermost last. Each group is an
+    # ordered dict of team -> packed h2h record within the group (deletes
+    # are O(1)). When a step separates a tied subgroup from the rest, the
+    # subgroup is moved onto the stack and fully ordered before its parent
+    # group carries on; the parent's records just drop the moved teams' cells.
+    stack = [new_group(tied_teams)]
     result = []
     
-    while len(remaining) > 1:
-        h2h_records = {}
-        for team in remaining:
-            w, l, t = get_h2h_record_vs_group(stats, team, remaining)
-            h2h_records[team] = calculate_win_pct(w, l, t)
+    while stack:
+        remaining = stack[-1]
+        if len(remaining) <= 1:
+            result.extend(remaining)
+            stack.pop()
+            continue
         
+        h2h_records = {team: calculate_win_pct(*_unpack_h2h(packed)) for team, packed in remaining.items()}
         best_pct = max(h2h_records.values())
         best_teams = [t for t in remaining if h2h_records[t] == best_pct]
         
-        if len(best_teams) < len(remaining):
-            if len(best_teams) == 1:
-                result.append(best_teams[0])
-                remaining.remove(best_teams[0])
-            else:
-                ordered_best = _break_tie_division_multi(stats, best_teams, divisions, h2h_points_override)
-                result.extend(ordered_best)
-                for t in ordered_best:
-                    remaining.remove(t)
-            continue
-        
-        div_records = {t: calculate_win_pct(stats[t]['division_wins'], stats[t]['division_losses'], stats[t]['division_ties']) for t in remaining}
-        best_div = max(div_records.values())
-        best_teams = [t for t in remaining if div_records[t] == best_div]
+        if len(best_teams) == len(remaining):
+            best_div = max(div_pct[t] for t in remaining)
+            best_teams = [t for t in remaining if div_pct[t] == best_div]
         
-        if len(best_teams) < len(remaining):
-            if len(best_teams) == 1:
-                result.append(best_teams[0])
-                remaining.remove(best_teams[0])
-            else:
-                ordered_best = _break_tie_division_multi(stats, best_teams, divisions, h2h_points_override)
-                result.extend(ordered_best)
-                for t in ordered_best:
-                    remaining.remove(t)
-            continue
+        if len(best_teams) == len(remaining):
+            best_pts = max(points_for[t] for t in remaining)
+            best_teams = [t for t in remaining if points_for[t] == best_pts]
         
-        total_points = {t: stats[t]['points_for'] for t in remaining}
-        best_pts = max(total_points.values())
-        best_teams = [t for t in remaining if total_points[t] == best_pts]
-        
-        if len(best_teams) < len(remaining):
-            if len(best_teams) == 1:
-                result.append(best_teams[0])
-                remaining.remove(best_teams[0])
-            else:
-                ordered_best = _break_tie_division_multi(stats, best_teams, divisions, h2h_points_override)
-                result.extend(ordered_best)
-                for t in ordered_best:
-                    remaining.remove(t)
-            continue
-        
-        matrix_ranks = {t: stats[t]['matrix_rank'] for t in remaining}
-        best_rank = min(matrix_ranks.values())
-        best_teams = [t for t in remaining if matrix_ranks[t] == best_rank]
+        if len(best_teams) == len(remaining):
+            best_rank = min(matrix_rank[t] for t in remaining)
+            best_teams = [t for t in remaining if matrix_rank[t] == best_rank]
+            if len(best_teams) > 1:
+                # Tied on everything: alphabetical
+                result.extend(sorted(remaining))
+                stack.pop()
+                continue
         
+        for t in best_teams:
+            del remaining[t]
+        for t in remaining:
+            remaining[t] -= sum(rows[t][b] for b in best_teams)
         if len(best_teams) == 1:
             result.append(best_teams[0])
-            remaining.remove(best_teams[0])
-            continue
-        
-        result.extend(sorted(remaining))
-        remaining = []
-    
-    if remaining:
-        result.extend(remaining)
+        else:
+            stack.append(new_group(best_teams))
     
     return result
 
 
-def break_tie_wildcard(stats, tied_teams, teams, divisions):
+def break_tie_wildcard(stats, tied_teams, teams, divisions, team_to_div=None, derived=None):
     if len(tied_teams) == 1:
         return tied_teams
     
+    if team_to_div is None:
+        team_to_div = build_team_division_map(divisions)
+    if derived is None:
+        derived = build_tiebreak_stats(stats, teams)
+    
     by_division = defaultdict(list)
     for team in tied_teams:
-        div = get_team_division(team, divisions)
+        div = team_to_div[team]
         by_division[div].append(team)
     
     if len(by_division) == 1:
-        return break_tie_division(stats, tied_teams, divisions)
+        return break_tie_division(stats, tied_teams, divisions, derived=derived)
     
     ordered_by_div = {}
     for div, div_teams in by_division.items():
         if len(div_teams) > 1:
-            ordered_by_div[div] = break_tie_division(stats, div_teams, divisions)
+            ordered_by_div[div] = break_tie_division(stats, div_teams, divisions, derived=derived)
         else:
             ordered_by_div[div] = div_teams
     
+    # Merge the division orders: each round the best of the division leaders
+    # goes next. Emptied divisions are dropped, and once a single division is
+    # left its remaining order is final.
     result = []
-    remaining_by_div = {div: list(div_teams) for div, div_teams in ordered_by_div.items()}
+    remaining_by_div = {div: deque(div_teams) for div, div_teams in ordered_by_div.items()}
     
-    while sum(len(teams) for teams in remaining_by_div.values()) > 0:
-        candidates = []
-        for div, div_teams in remaining_by_div.items():
-            if div_teams:
-                candidates.append(div_teams[0])
-        
-        if len(candidates) == 1:
-            team = candidates[0]
-            result.append(team)
-            div = get_team_division(team, divisions)
-            remaining_by_div[div].pop(0)
-        else:
-            best = _compare_cross_division(stats, candidates, teams, divisions)
-            result.append(best)
-            div = get_team_division(best, divisions)
-            remaining_by_div[div].pop(0)
+    while len(remaining_by_div) > 1:
+        candidates = [div_teams[0] for div_teams in remaining_by_div.values()]
+        best = _compare_cross_division(stats, candidates, teams, divisions, derived)
+        result.append(best)
+        div = team_to_div[best]
+        remaining_by_div[div].popleft()
+        if not remaining_by_div[div]:
+            del remaining_by_div[div]
+    
+    for div_teams in remaining_by_div.values():
+        result.extend(div_teams)
     
     return result
 
 
-def _compare_cross_division(stats, candidates, all_teams, divisions):
+def _compare_cross_division(stats, candidates, all_teams, divisions, derived=None):
     if len(candidates) == 1:
         return candidates[0]
     
+    if derived is None:
+        derived = build_tiebreak_stats(stats, all_teams)
+    points_for = derived['points_for']
+    matrix_rank = derived['matrix_rank']
+    
     if len(candidates) == 2:
         t1, t2 = candidates
         w1, l1, _ = get_h2h_record(stats, t1, t2)
         w2, l2, _ = get_h2h_record(stats, t2, t1)
-        if w1 > w2:
-            return t1
-        elif w2 > w1:
-            return t2
-        
-        sos1 = calculate_strength_of_schedule(stats, t1, all_teams)
-        sos2 = calculate_strength_of_schedule(stats, t2, all_teams)
-        if sos1 > sos2:
-            return t1
-        elif sos2 > sos1:
-            return t2
+        if w1 != w2:
+            return t1 if w1 > w2 else t2
         
-        if stats[t1]['points_for'] > stats[t2]['points_for']:
-            return t1
-        elif stats[t2]['points_for'] > stats[t1]['points_for']:
-            return t2
+        # SoS, points for, matrix rank, then name; SoS only once H2H is level
+        def key(team):
+            return (-_get_strength_of_schedule(stats, derived, team), -points_for[team], matrix_rank[team], team)
         
-        if stats[t1]['matrix_rank'] < stats[t2]['matrix_rank']:
-            return t1
-        elif stats[t2]['matrix_rank'] < stats[t1]['matrix_rank']:
-            return t2
-        
-        return sorted(candidates)[0]
+        return t1 if key(t1) < key(t2) else t2
     
     remaining = list(candidates)
     
     h2h_records = {}
     for team in remaining:
-        w, l, t = get_h2h_record_vs_group(stats, team, remaining)
+        w, l, t = _get_h2h_record_vs_group(stats, derived, team, remaining)
         h2h_records[team] = calculate_win_pct(w, l, t)
     
     best_pct = max(h2h_records.values())
@@ -462,7 +587,7 @@ def _compare_cross_division(stats, candidates, all_teams, divisions):
     
     remaining = best_teams
     
-    sos = {t: calculate_strength_of_schedule(stats, t, all_teams) for t in remaining}
+    sos = {t: _get_strength_of_schedule(stats, derived, t) for t in remaining}
     best_sos = max(sos.values())
     best_teams = [t for t in remaining if sos[t] == best_sos]
     
@@ -471,7 +596,7 @@ def _compare_cross_division(stats, candidates, all_teams, divisions):
     
     remaining = best_teams
     
-    points = {t: stats[t]['points_for'] for t in remaining}
+    points = {t: points_for[t] for t in remaining}
     best_pts = max(points.values())
     best_teams = [t for t in remaining if points[t] == best_pts]
     
@@ -480,7 +605,7 @@ def _compare_cross_division(stats, candidates, all_teams, divisions):
     
     remaining = best_teams
     
-    ranks = {t: stats[t]['matrix_rank'] for t in remaining}
+    ranks = {t: matrix_rank[t] for t in remaining}
     best_rank = min(ranks.values())
     best_teams = [t for t in remaining if ranks[t] == best_rank]
     
@@ -490,82 +615,93 @@ def _compare_cross_division(stats, candidates, all_teams, divisions):
     return sorted(remaining)[0]
 
 
-def rank_division(stats, division_teams, divisions, h2h_points_override=None):
-    by_record = defaultdict(list)
-    for team in division_teams:
-        record = (stats[team]['wins'], stats[team]['losses'], stats[team]['ties'])
-        by_record[record].append(team)
+def rank_division(stats, division_teams, divisions, h2h_points_override=None, derived=None):
+    if derived is None:
+        derived = build_tiebreak_stats(stats, division_teams)
+    records = derived['records']
     
-    sorted_records = sorted(by_record.keys(), key=lambda r: (-r[0], r[1], r[2]))
+    def record_key(t):
+        w, l, tie = records[t]
+        return (-w, l, tie)
     
     ranking = []
-    for record in sorted_records:
-        tied_teams = by_record[record]
+    for _, group in groupby(sorted(division_teams, key=record_key), key=records.__getitem__):
+        tied_teams = list(group)
         if len(tied_teams) == 1:
             ranking.extend(tied_teams)
         else:
-            ranking.extend(break_tie_division(stats, tied_teams, divisions, h2h_points_override))
+            ranking.extend(break_tie_division(stats, tied_teams, divisions, h2h_points_override, derived))
     
     return ranking
 
 
-def determine_playoff_teams(stats, teams, divisions, h2h_points_override=None):
-    division_rankings = {}
+def best_in_division(stats, division_teams, divisions, h2h_points_override=None, derived=None):
+    """rank_division(...)[0] without ordering anyone below the top record."""
+    if derived is None:
+        derived = build_tiebreak_stats(stats, division_teams)
+    records = derived['records']
+    
+    def record_key(t):
+        w, l, tie = records[t]
+        return (-w, l, tie)
+    
+    best = record_key(min(division_teams, key=record_key))
+    leaders = [t for t in division_teams if record_key(t) == best]
+    if len(leaders) == 1:
+        return leaders[0]
+    return break_tie_division(stats, leaders, divisions, h2h_points_override, derived)[0]
+
+
+def determine_playoff_teams(stats, teams, divisions, h2h_points_override=None, team_to_div=None, games_matrix=None,
+                            clinched_division_winners=None, eliminated=frozenset()):
+    if team_to_div is None:
+        team_to_div = build_team_division_map(divisions)
+    derived = build_tiebreak_stats(stats, teams, games_matrix)
+    
+    # Only the top of each division is used here; skip ranking divisions
+    # whose winner the caller already knows
+    clinched_division_winners = clinched_division_winners or {}
+    division_leaders = {}
     for div, div_teams in divisions.items():
-        division_rankings[div] = rank_division(stats, div_teams, divisions, h2h_points_override)
-    
-    division_winners = [division_rankings[div][0] for div in sorted(divisions.keys())]
-    non_winners = [t for t in teams if t not in division_winners]
-    
-    by_record = defaultdict(list)
-    for team in non_winners:
-        record = (stats[team]['wins'], stats[team]['losses'], stats[team]['ties'])
-        by_record[record].append(team)
-    
-    sorted_records = sorted(by_record.keys(), key=lambda r: (-r[0], r[1], r[2]))
-    
-    num_wildcards = 6 - len(division_winners)
-    wild_cards = []
-    for record in sorted_records:
-        if len(wild_cards) >= num_wildcards:
-            break
-        tied_teams = by_record[record]
-        spots_remaining = num_wildcards - len(wild_cards)
-        if len(tied_teams) <= spots_remaining:
-            wild_cards.extend(tied_teams)
+        if div in clinched_division_winners:
+            division_leaders[div] = clinched_division_winners[div]
         else:
-            ordered = break_tie_wildcard(stats, tied_teams, teams, divisions)
-            wild_cards.extend(ordered[:spots_remaining])
+            division_leaders[div] = best_in_division(stats, div_teams, divisions, h2h_points_override, derived)
     
-    winner_records = defaultdict(list)
-    for team in division_winners:
-        record = (stats[team]['wins'], stats[team]['losses'], stats[team]['ties'])
-        winner_records[record].append(team)
+    division_winners = [division_leaders[div] for div in sorted(divisions.keys())]
+    winner_set = set(division_winners)
     
-    sorted_winner_records = sorted(winner_records.keys(), key=lambda r: (-r[0], r[1], r[2]))
+    record_of = derived['records']
     
+    def record_key(t):
+        w, l, tie = record_of[t]
+        return (-w, l, tie)
+    
+    # Seed winners by record, breaking ties within each record group
     seeded_winners = []
-    for record in sorted_winner_records:
-        tied = winner_records[record]
+    for _, group in groupby(sorted(division_winners, key=record_key), key=record_of.__getitem__):
+        tied = list(group)
         if len(tied) == 1:
             seeded_winners.extend(tied)
         else:
-            seeded_winners.extend(break_tie_wildcard(stats, tied, teams, divisions))
-    
-    wc_records = defaultdict(list)
-    for team in wild_cards:
-        record = (stats[team]['wins'], stats[team]['losses'], stats[team]['ties'])
-        wc_records[record].append(team)
-    
-    sorted_wc_records = sorted(wc_records.keys(), key=lambda r: (-r[0], r[1], r[2]))
+            seeded_winners.extend(break_tie_wildcard(stats, tied, teams, divisions, team_to_div, derived))
     
+    # Fill and seed wildcards in the same pass; groups come out in record order
+    # Teams the caller knows can never reach a wild card are left out of the race
+    non_winners = sorted((t for t in teams if t not in winner_set and t not in eliminated), key=record_key)
+    num_wildcards = 6 - len(division_winners)
     seeded_wildcards = []
-    for record in sorted_wc_records:
-        tied = wc_records[record]
+    for _, group in groupby(non_winners, key=record_of.__getitem__):
+        spots_remaining = num_wildcards - len(seeded_wildcards)
+        if spots_remaining <= 0:
+            break
+        tied = list(group)
+        if len(tied) > spots_remaining:
+            tied = break_tie_wildcard(stats, tied, teams, divisions, team_to_div, derived)[:spots_remaining]
         if len(tied) == 1:
             seeded_wildcards.extend(tied)
         else:
-            seeded_wildcards.extend(break_tie_wildcard(stats, tied, teams, divisions))
+            seeded_wildcards.extend(break_tie_wildcard(stats, tied, teams, divisions, team_to_div, derived))
     
     playoff_teams = []
     for i, team in enumerate(seeded_winners):
@@ -575,7 +711,7 @@ def determine_playoff_teams(stats, teams, divisions, h2h_points_override=None):
             'is_division_winner': True,
             'has_bye': i < 2,
             'record': f"{stats[team]['wins']}-{stats[team]['losses']}",
-            'division': get_team_division(team, divisions)
+            'division': team_to_div[team]
         })
     for i, team in enumerate(seeded_wildcards):
         playoff_teams.append({
@@ -584,13 +720,13 @@ def determine_playoff_teams(stats, teams, divisions, h2h_points_override=None):
             'is_division_winner': False,
             'has_bye': False,
             'record': f"{stats[team]['wins']}-{stats[team]['losses']}",
-            'division': get_team_division(team, divisions)
+            'division': team_to_div[team]
         })
     
     return playoff_teams
 
 
-def determine_relegation_teams(stats, playoff_teams, teams, divisions):
+def determine_relegation_teams(stats, playoff_teams, teams, divisions, team_to_div=None, games_matrix=None):
     """
     Determine relegation teams using bottom-up approach:
     1. Start from worst record
@@ -600,28 +736,32 @@ def determine_relegation_teams(stats, playoff_teams, teams, divisions):
     5. The loser goes to relegation
     6. Repeat until we have 4 teams
     """
-    playoff_team_names = [p['team'] for p in playoff_teams]
+    if team_to_div is None:
+        team_to_div = build_team_division_map(divisions)
+    
+    playoff_team_names = {p['team'] for p in playoff_teams}
     non_playoff_teams = [t for t in teams if t not in playoff_team_names]
     
     relegation_teams = []
+    # Tiebreak stats (packed h2h, strength of schedule) for tied records, built on first need
+    derived = None
+    
+    # Lowest sorts worst: fewest wins, then most losses, then most ties
+    worst_first = {}
+    for t in non_playoff_teams:
+        wins, losses, ties = _RECORD(stats[t])
+        worst_first[t] = (wins, -losses, -ties)
+    
+    # Teams not yet relegated, as an ordered set
+    remaining = dict.fromkeys(non_playoff_teams)
     
     # Pick relegation teams one at a time, from worst to better
-    while len(relegation_teams) < 4:
-        remaining = [t for t in non_playoff_teams if t not in relegation_teams]
-        if not remaining:
-            break
-        
+    while len(relegation_teams) < 4 and remaining:
         # Find worst record among remaining
-        worst_record = min(
-            (stats[t]['wins'], -stats[t]['losses'], -stats[t].get('ties', 0)) 
-            for t in remaining
-        )
+        worst_record = min(worst_first[t] for t in remaining)
         
         # Get teams with that record
-        worst_teams = [
-            t for t in remaining 
-            if (stats[t]['wins'], -stats[t]['losses'], -stats[t].get('ties', 0)) == worst_record
-        ]
+        worst_teams = [t for t in remaining if worst_first[t] == worst_record]
         
         if len(worst_teams) == 1:
             # Only one team with worst record, they're relegated
@@ -631,13 +771,16 @@ def determine_relegation_teams(stats, playoff_teams, teams, divisions):
             # Group by division
             by_division = defaultdict(list)
             for team in worst_teams:
-                div = get_team_division(team, divisions)
+                div = team_to_div[team]
                 by_division[div].append(team)
             
+            if derived is None:
+                derived = build_tiebreak_stats(stats, teams, games_matrix)
+            
             # Order each division using Division Tiebreaker (best to worst)
             ordered_by_div = {}
             for div, div_teams in by_division.items():
-                ordered_by_div[div] = get_lowest_in_division_for_relegation(stats, div_teams)
+                ordered_by_div[div] = get_lowest_in_division_for_relegation(stats, div_teams, derived)
             
             # Take the LOWEST (last) from each division
             lowest_from_each = []
@@ -653,10 +796,12 @@ def determine_relegation_teams(stats, playoff_teams, teams, divisions):
                 # Keep eliminating the "best" until only the worst remains
                 remaining_candidates = list(lowest_from_each)
                 while len(remaining_candidates) > 1:
-                    best = compare_cross_division_for_relegation(stats, remaining_candidates, teams, divisions)
+                    best = compare_cross_division_for_relegation(stats, remaining_candidates, teams, divisions, derived)
                     remaining_candidates.remove(best)
                 loser = remaining_candidates[0]
                 relegation_teams.append(loser)
+        
+        del remaining[relegation_teams[-1]]
     
     # Seed the relegation bracket
     # First added = worst (lost tiebreaker first) = #1 seed
@@ -667,53 +812,117 @@ def determine_relegation_teams(stats, playoff_teams, teams, divisions):
             'seed': i + 1,
             'team': team,
             'record': f"{stats[team]['wins']}-{stats[team]['losses']}",
-            'division': get_team_division(team, divisions)
+            'division': team_to_div[team]
         })
     
     return result
 
 
+def _clone_stats(stats):
+    """Copy {team: {field: number, 'h2h': {opp: {field: number}}}} without deepcopy's memo walk."""
+    cloned = {}
+    for team, team_stats in stats.items():
+        row = dict(team_stats)
+        row['h2h'] = {opp: dict(h2h) for opp, h2h in team_stats['h2h'].items()}
+        cloned[team] = row
+    return cloned
+
+
+def _clone_stats_for_games(stats, games):
+    """
+    Copy only what applying `games` [(away, home)] mutates: the playing teams'
+    rows and their h2h cells against each other. Every other row and cell is
+    shared with `stats`, so the result must only be read outside those games.
+    """
+    cloned = dict(stats)
+    for away, home in games:
+        for team, opp in ((away, home), (home, away)):
+            row = cloned[team]
+            if row is stats[team]:
+                row = cloned[team] = dict(row)
+                row['h2h'] = dict(row['h2h'])
+            row['h2h'][opp] = dict(row['h2h'][opp])
+    return cloned
+
+
+def _apply_matchup(stats, away, home, winner_side, is_div):
+    """Apply a single Week 14 result to stats in place. Returns a callable that reverts it."""
+    if winner_side == 'away':
+        winner, loser = away, home
+    else:
+        winner, loser = home, away
+    
+    winner_stats = stats[winner]
+    loser_stats = stats[loser]
+    winner_stats['wins'] += 1
+    loser_stats['losses'] += 1
+    winner_stats['h2h'][loser]['wins'] += 1
+    loser_stats['h2h'][winner]['losses'] += 1
+    if is_div:
+        winner_stats['division_wins'] += 1
+        loser_stats['division_losses'] += 1
+    
+    def undo():
+        winner_stats['wins'] -= 1
+        loser_stats['losses'] -= 1
+        winner_stats['h2h'][loser]['wins'] -= 1
+        loser_stats['h2h'][winner]['losses'] -= 1
+        if is_div:
+            winner_stats['division_wins'] -= 1
+            loser_stats['division_losses'] -= 1
+    
+    return undo
+
+
+def _margin_h2h_override(league_name, away, home, winner_side, margin):
+    """H2H points override for games where the margin decides a tiebreaker."""
+    # Handle margin for FFPL LPH vs ReBiggulators
+    if league_name == 'FFPL' and away == 'The ReBiggulators' and home == 'Los Pollos Hermanos':
+        if winner_side == 'away' and margin >= 3:
+            return {
+                ('The ReBiggulators', 'Los Pollos Hermanos'): (61, 53),
+                ('Los Pollos Hermanos', 'The ReBiggulators'): (53, 61),
+            }
+    return None
+
+
+def resolve_selections(games, selections):
+    """
+    [(winner_side, margin)] by game index for request selections keyed by
+    game_id string; games without a selection default to a home win by 5.
+    The string keys are only touched here, once per request. Values are
+    normalized to 'away'/'home' and an int margin (5 if it isn't a number),
+    so the result is hashable whatever the request JSON holds.
+    """
+    resolved = []
+    for _, _, _, game_id in games:
+        selection = selections.get(game_id)
+        if not isinstance(selection, dict):
+            selection = {}
+        winner_side = 'away' if selection.get('winner') == 'away' else 'home'
+        try:
+            margin = int(selection.get('margin', 5))
+        except (TypeError, ValueError, OverflowError):
+            margin = 5
+        resolved.append((winner_side, margin))
+    return resolved
+
+
 def simulate_week14_outcome(base_stats, selections, matchups, divisions, league_name):
     """Simulate Week 14 based on user selections."""
-    new_stats = copy.deepcopy(base_stats)
     h2h_points_override = None
     
-    for matchup in matchups:
-        away = matchup['away_team']
-        home = matchup['home_team']
-        is_div = matchup['is_division_game']
-        game_id = f"{away}_at_{home}".replace("'", "").replace(" ", "_")
-        
-        selection = selections.get(game_id, {'winner': 'home', 'margin': 5})
-        winner_side = selection.get('winner', 'home')
-        margin = selection.get('margin', 5)
-        
-        if winner_side == 'away':
-            new_stats[away]['wins'] += 1
-            new_stats[home]['losses'] += 1
-            if away in new_stats[away]['h2h']:
-                pass  # Already handled
-            new_stats[away]['h2h'][home]['wins'] = new_stats[away]['h2h'].get(home, {}).get('wins', 0) + 1
-            new_stats[home]['h2h'][away]['losses'] = new_stats[home]['h2h'].get(away, {}).get('losses', 0) + 1
-            if is_div:
-                new_stats[away]['division_wins'] += 1
-                new_stats[home]['division_losses'] += 1
-        else:
-            new_stats[home]['wins'] += 1
-            new_stats[away]['losses'] += 1
-            new_stats[home]['h2h'][away]['wins'] = new_stats[home]['h2h'].get(away, {}).get('wins', 0) + 1
-            new_stats[away]['h2h'][home]['losses'] = new_stats[away]['h2h'].get(home, {}).get('losses', 0) + 1
-            if is_div:
-                new_stats[home]['division_wins'] += 1
-                new_stats[away]['division_losses'] += 1
-        
-        # Handle margin for FFPL LPH vs ReBiggulators
-        if league_name == 'FFPL' and away == 'The ReBiggulators' and home == 'Los Pollos Hermanos':
-            if winner_side == 'away' and margin >= 3:
-                h2h_points_override = {
-                    ('The ReBiggulators', 'Los Pollos Hermanos'): (61, 53),
-                    ('Los Pollos Hermanos', 'The ReBiggulators'): (53, 61),
-                }
+    if matchups is ALL_LEAGUES[league_name]['week14_matchups']:
+        games = MATCHUP_GAME_IDS[league_name]
+    else:
+        games = build_matchup_game_ids(matchups)
+    new_stats = _clone_stats_for_games(base_stats, [(away, home) for away, home, _, _ in games])
+    
+    for (away, home, is_div, _), (winner_side, margin) in zip(games, resolve_selections(games, selections)):
+        _apply_matchup(new_stats, away, home, winner_side, is_div)
+        h2h_points_override = _margin_h2h_override(league_name, away, home, winner_side, margin) or h2h_points_override
+        for team in (away, home):
+            new_stats[team]['record_str'] = f"{new_stats[team]['wins']}-{new_stats[team]['losses']}"
     
     return new_stats, h2h_points_override
 
@@ -726,157 +935,483 @@ def get_matchup_win_probability(away_team, home_team, matchup_probs):
     return 0.5
 
 
-def get_team_summary_weighted(league_name):
-    """Get summary of each team's playoff/relegation situation."""
+# Playoff/relegation results keyed by final standings. Only records and the
+# Week 14 head-to-head cells change between scenarios (points and matrix ranks
+# come straight from the league data), so those fully determine the outcome.
+_STANDINGS_CACHE = {}
+
+
+def _standings_key(league_name, stats, teams, h2h_points_override):
+    records = tuple(_FULL_RECORD(stats[t]) for t in teams)
+    week14_h2h = tuple(_RECORD(stats[away]['h2h'][home]) for away, home, _, _ in MATCHUP_GAME_IDS[league_name])
+    override = tuple(sorted(h2h_points_override.items())) if h2h_points_override else None
+    return (league_name, records, week14_h2h, override)
+
+
+def evaluate_standings(league_name, stats, teams, divisions, matchups, has_relegation, h2h_points_override=None):
+    """Return (playoff_teams, relegation_teams) for final standings, memoized."""
+    key = _standings_key(league_name, stats, teams, h2h_points_override)
+    cached = _STANDINGS_CACHE.get(key)
+    if cached is None:
+        team_to_div = TEAM_DIVISION[league_name]
+        playoff_teams = determine_playoff_teams(
+            stats, teams, divisions, h2h_points_override, team_to_div, FINAL_GAMES_MATRIX[league_name],
+            CLINCHED_DIVISION_WINNERS[league_name], PLAYOFF_ELIMINATED[league_name]
+        )
+        if has_relegation:
+            relegation_teams = determine_relegation_teams(
+                stats, playoff_teams, teams, divisions, team_to_div, FINAL_GAMES_MATRIX[league_name]
+            )
+        else:
+            relegation_teams = []
+        cached = _STANDINGS_CACHE[key] = (playoff_teams, relegation_teams)
+    return cached
+
+
+def _build_final_games_matrix(league_info):
+    """Every Week 14 game is played whatever the result, so games-per-opponent is fixed."""
+    teams = league_info['teams']
+    games = build_games_matrix(league_info['stats'], teams)
+    index = {team: i for i, team in enumerate(teams)}
+    for m in league_info['week14_matchups']:
+        away, home = index[m['away_team']], index[m['home_team']]
+        games[away, home] += 1
+        games[home, away] += 1
+    return games
+
+
+FINAL_GAMES_MATRIX = {
+    league_name: _build_final_games_matrix(league_info)
+    for league_name, league_info in ALL_LEAGUES.items()
+}
+
+
+def _week14_record_bounds(league_info):
+    """
+    Record sort keys (-wins, losses, ties) per team after Week 14:
+    (best, worst), from winning or losing every remaining game.
+    """
+    stats = league_info['stats']
+    games_left = defaultdict(int)
+    for m in league_info['week14_matchups']:
+        games_left[m['away_team']] += 1
+        games_left[m['home_team']] += 1
+    
+    bounds = {}
+    for team in league_info['teams']:
+        s = stats[team]
+        g = games_left[team]
+        bounds[team] = (
+            (-(s['wins'] + g), s['losses'], s['ties']),
+            (-s['wins'], s['losses'] + g, s['ties']),
+        )
+    return bounds
+
+
+def _find_clinched_division_winners(league_info):
+    """
+    Divisions whose winner is the same in every Week 14 outcome: the leader's
+    record after losing every remaining game still sorts strictly ahead of each
+    rival's record after winning every remaining game, so no tiebreak is involved.
+    """
+    bounds = _week14_record_bounds(league_info)
+    
+    clinched = {}
+    for div, div_teams in league_info['divisions'].items():
+        leader = min(div_teams, key=lambda t: bounds[t][1])
+        if all(bounds[leader][1] < bounds[t][0] for t in div_teams if t != leader):
+            clinched[div] = leader
+    return clinched
+
+
+CLINCHED_DIVISION_WINNERS = {
+    league_name: _find_clinched_division_winners(league_info)
+    for league_name, league_info in ALL_LEAGUES.items()
+}
+
+
+def _find_eliminated_teams(league_info):
+    """
+    Teams that miss the playoffs in every Week 14 outcome on record alone:
+    a division mate always finishes strictly ahead of them, and so do at
+    least six teams league-wide. Whichever of those six win divisions, the
+    rest outnumber the 6 - divisions wild cards and all rank ahead.
+    """
+    bounds = _week14_record_bounds(league_info)
+    
+    eliminated = set()
+    for div, div_teams in league_info['divisions'].items():
+        for team in div_teams:
+            best = bounds[team][0]
+            always_ahead = [t for t in league_info['teams'] if bounds[t][1] < best]
+            if len(always_ahead) >= 6 and any(t in div_teams for t in always_ahead):
+                eliminated.add(team)
+    return frozenset(eliminated)
+
+
+PLAYOFF_ELIMINATED = {
+    league_name: _find_eliminated_teams(league_info)
+    for league_name, league_info in ALL_LEAGUES.items()
+}
+
+
+# Scenario count from which the weighted summary is split across worker
+# processes; below it, process start-up costs more than the enumeration
+_PARALLEL_MIN_SCENARIOS = 1 << 12
+
+_SUMMARY_FIELDS = ('championship_pct', 'bye_pct', 'relegation_pct', 'safe_pct')
+# Summary status names, indexed by the status codes np.select picks
+_STATUSES = ('clinched_playoffs', 'playoff_contender', 'clinched_relegation', 'relegation_danger', 'safe')
+
+# Up to this many undecided games every outcome is enumerated exactly; beyond
+# it the summary is estimated from a fixed-seed sample of outcomes instead
+_EXACT_MAX_LIVE_GAMES = 16
+_SUMMARY_SAMPLES = 20000
+_SUMMARY_SAMPLE_SEED = 14
+# Samples are drawn in this many independently seeded batches, so the
+# estimate is the same whether the batches run serially or on the pool
+_SUMMARY_SAMPLE_BATCHES = 8
+
+
+def _resolve_week14_win_probs(league_data):
+    """Attach away_win_pct, home_win_pct and favored to each Week 14 matchup."""
+    matchup_probs = league_data.get('matchup_probs', {})
+    for m in league_data['week14_matchups']:
+        away_prob = get_matchup_win_probability(m['away_team'], m['home_team'], matchup_probs)
+        m['away_win_pct'] = away_prob
+        m['home_win_pct'] = 1 - away_prob
+        m['favored'] = 'away' if away_prob > 1 - away_prob else 'home'
+
+
+for _league in ALL_LEAGUES.values():
+    _resolve_week14_win_probs(_league)
+
+
+def _week14_game_probs(league_data):
+    """(away_win_prob, home_win_prob) for each Week 14 matchup, in schedule order."""
+    return [(m['away_win_pct'], m['home_win_pct']) for m in league_data['week14_matchups']]
+
+
+def _week14_game_overrides(league_name):
+    """(override if away wins, override if home wins) per Week 14 game, at the default margin."""
+    return [
+        (_margin_h2h_override(league_name, away, home, 'away', 5),
+         _margin_h2h_override(league_name, away, home, 'home', 5))
+        for away, home, _, _ in MATCHUP_GAME_IDS[league_name]
+    ]
+
+
+# Per-league Week 14 inputs of the summary enumeration; fixed after load
+WEEK14_GAME_PROBS = {
+    league_name: _week14_game_probs(league_info)
+    for league_name, league_info in ALL_LEAGUES.items()
+}
+WEEK14_GAME_OVERRIDES = {league_name: _week14_game_overrides(league_name) for league_name in ALL_LEAGUES}
+
+
+def _accumulate_scenarios(league_name, start, stop):
+    """
+    Evaluate Week 14 scenarios [start, stop) of the Gray code enumeration.
+    Returns (total_prob, {team: [championship, bye, relegation, safe]}) with
+    each entry summing the probability of the scenarios where it applies.
+    """
     league_data = ALL_LEAGUES[league_name]
     teams = league_data['teams']
     divisions = league_data['divisions']
     stats = league_data['stats']
     matchups = league_data['week14_matchups']
-    matchup_probs = league_data.get('matchup_probs', {})
     has_relegation = league_data['has_relegation']
+    games = MATCHUP_GAME_IDS[league_name]
+    game_probs = WEEK14_GAME_PROBS[league_name]
+    side_overrides = WEEK14_GAME_OVERRIDES[league_name]
+    num_games = len(games)
     
-    summary = {team: {
-        'current_record': f"{stats[team]['wins']}-{stats[team]['losses']}",
-        'division': get_team_division(team, divisions),
-        'championship_pct': 0.0,
-        'bye_pct': 0.0,
-        'relegation_pct': 0.0,
-        'safe_pct': 0.0,
-        'status': '',
-    } for team in teams}
-    
-    matchup_list = [(m['away_team'], m['home_team']) for m in matchups]
+    total_prob = 0.0
+    outcome_weights = {}
+    
+    # Games with a certain result (a 0% side in the power matrix) have
+    # only one reachable outcome, so apply it up front and enumerate the
+    # remaining live games only. Every other game can change a
+    # tiebreaker (H2H, strength of schedule) somewhere in the league.
+    work_stats = _clone_stats(stats)
+    undo_game = [None] * num_games
+    game_override = [None] * num_games
+    results = [0] * num_games
+    live_games = [i for i, (away_prob, home_prob) in enumerate(game_probs) if away_prob and home_prob]
+    start_code = start ^ (start >> 1)
+    for bit, i in enumerate(live_games):
+        results[i] = (start_code >> bit) & 1
+    
+    for i, (away, home, is_div, _) in enumerate(games):
+        away_prob, home_prob = game_probs[i]
+        if not (away_prob and home_prob):
+            results[i] = 0 if away_prob else 1
+        winner_side = 'home' if results[i] else 'away'
+        undo_game[i] = _apply_matchup(work_stats, away, home, winner_side, is_div)
+        game_override[i] = side_overrides[i][results[i]]
+    
+    # Only games whose margin can matter ever produce an override
+    margin_games = [i for i, overrides in enumerate(side_overrides) if any(overrides)]
+    
+    # Probability of every scenario in the range at once: bit b of a step's
+    # Gray code is the result of live game b, and certain games contribute 1
+    codes = np.arange(start, stop, dtype=np.int64)
+    codes ^= codes >> 1
+    live_bits = (codes[:, None] >> np.arange(len(live_games))) & 1
+    live_probs = np.array([game_probs[i] for i in live_games], dtype=np.float64).reshape(-1, 2)
+    scenario_probs = live_probs[np.arange(len(live_games)), live_bits].prod(axis=1).tolist()
+    
+    # Visit the live outcomes in Gray code order: consecutive scenarios
+    # differ in exactly one game, so each step reverts that game and
+    # applies the other result.
+    for step, scenario_prob in zip(range(start, stop), scenario_probs):
+        if step > start:
+            i = live_games[(step & -step).bit_length() - 1]
+            results[i] ^= 1
+            winner_side = 'home' if results[i] else 'away'
+            away, home, is_div, _ = games[i]
+            
+            undo_game[i]()
+            undo_game[i] = _apply_matchup(work_stats, away, home, winner_side, is_div)
+            game_override[i] = side_overrides[i][results[i]]
+        
+        h2h_override = None
+        for i in margin_games:
+            h2h_override = game_override[i] or h2h_override
+        
+        total_prob += scenario_prob
+        
+        outcome = evaluate_standings(
+            league_name, work_stats, teams, divisions, matchups, has_relegation, h2h_override
+        )
+        _add_outcome_weight(outcome_weights, outcome, scenario_prob)
     
-    game_probs = []
-    for away, home in matchup_list:
-        away_prob = get_matchup_win_probability(away, home, matchup_probs)
-        game_probs.append((away_prob, 1 - away_prob))
+    return total_prob, _outcome_sums(teams, outcome_weights)
+
+
+def _add_outcome_weight(outcome_weights, outcome, weight):
+    """
+    Add `weight` to an evaluate_standings result. Memoized results are shared
+    objects, so identical outcomes collapse onto one entry by identity.
+    """
+    entry = outcome_weights.get(id(outcome))
+    if entry is None:
+        outcome_weights[id(outcome)] = [outcome, weight]
+    else:
+        entry[1] += weight
+
+
+def _outcome_sums(teams, outcome_weights):
+    """{team: [championship, bye, relegation, safe]} weighted over the distinct outcomes."""
+    team_index = {team: i for i, team in enumerate(teams)}
+    weights = np.empty(len(outcome_weights))
+    # (outcomes x teams x fields) 0/1 placements. Columns: championship, bye,
+    # relegation, safe; safe unless placed elsewhere
+    placed = np.zeros((len(outcome_weights), len(teams), len(_SUMMARY_FIELDS)))
+    placed[:, :, 3] = 1.0
+    for k, ((playoff_teams, relegation_teams), weight) in enumerate(outcome_weights.values()):
+        weights[k] = weight
+        for p in playoff_teams:
+            i = team_index[p['team']]
+            placed[k, i, 0] = 1.0
+            placed[k, i, 1] = 1.0 if p['has_bye'] else 0.0
+            placed[k, i, 3] = 0.0
+        for r in relegation_teams:
+            i = team_index[r['team']]
+            placed[k, i, 2] = 1.0
+            placed[k, i, 3] = 0.0
+    # Weighted sum over all outcomes in one contraction
+    totals = np.tensordot(weights, placed, axes=1)
+    return dict(zip(teams, totals.tolist()))
+
+
+def _sample_scenarios(league_name, num_samples, seed):
+    """
+    Estimate the summary sums from `num_samples` random Week 14 outcomes, each
+    game drawn from its win probability. Returns (num_samples, sums) in the
+    same shape as _accumulate_scenarios, every sampled outcome weighing 1.
+    """
+    league_data = ALL_LEAGUES[league_name]
+    teams = league_data['teams']
+    divisions = league_data['divisions']
+    matchups = league_data['week14_matchups']
+    has_relegation = league_data['has_relegation']
+    games = MATCHUP_GAME_IDS[league_name]
+    away_probs = np.array([away_prob for away_prob, _ in WEEK14_GAME_PROBS[league_name]])
+    side_overrides = WEEK14_GAME_OVERRIDES[league_name]
+    
+    # 1 = home win; a certain result (probability 0 or 1) is always drawn
+    rng = np.random.default_rng(seed)
+    draws = (rng.random((num_samples, len(games))) >= away_probs).astype(np.int8)
+    
+    outcome_weights = {}
+    work_stats = _clone_stats(league_data['stats'])
+    undo_game = [None] * len(games)
+    results = [None] * len(games)
+    outcome_cache = {}
+    
+    for row in map(tuple, draws.tolist()):
+        outcome = outcome_cache.get(row)
+        if outcome is None:
+            # Move the working stats to this outcome, re-applying changed games only
+            h2h_override = None
+            for i, (away, home, is_div, _) in enumerate(games):
+                if results[i] != row[i]:
+                    if undo_game[i] is not None:
+                        undo_game[i]()
+                    winner_side = 'home' if row[i] else 'away'
+                    undo_game[i] = _apply_matchup(work_stats, away, home, winner_side, is_div)
+                    results[i] = row[i]
+                h2h_override = side_overrides[i][row[i]] or h2h_override
+            outcome = outcome_cache[row] = evaluate_standings(
+                league_name, work_stats, teams, divisions, matchups, has_relegation, h2h_override
+            )
+        _add_outcome_weight(outcome_weights, outcome, 1.0)
+    
+    return float(num_samples), _outcome_sums(teams, outcome_weights)
+
+
+@lru_cache(maxsize=None)
+def get_team_summary_weighted(league_name):
+    """
+    Get summary of each team's playoff/relegation situation.
+    League data is read-only after load, so the result is cached per league;
+    callers must not mutate the returned dicts.
+    """
+    league_data = ALL_LEAGUES[league_name]
+    teams = league_data['teams']
+    divisions = league_data['divisions']
+    stats = league_data['stats']
+    matchups = league_data['week14_matchups']
+    has_relegation = league_data['has_relegation']
+    team_to_div = TEAM_DIVISION[league_name]
     
-    from itertools import product
+    # One row per team in teams order, one column per _SUMMARY_FIELDS entry
+    pcts = np.zeros((len(teams), len(_SUMMARY_FIELDS)))
+    team_idx = {team: i for i, team in enumerate(teams)}
+    champ_col, bye_col, releg_col, safe_col = range(len(_SUMMARY_FIELDS))
     
+    game_probs = WEEK14_GAME_PROBS[league_name]
     total_prob = 0.0
-    num_games = len(matchup_list)
+    num_games = len(matchups)
     
     if num_games == 0:
         # No games to simulate
-        playoff_teams = determine_playoff_teams(stats, teams, divisions)
+        playoff_teams = determine_playoff_teams(stats, teams, divisions, team_to_div=team_to_div)
         playoff_names = [p['team'] for p in playoff_teams]
         
         for p in playoff_teams:
-            summary[p['team']]['championship_pct'] = 100.0
+            pcts[team_idx[p['team']], champ_col] = 100.0
             if p['has_bye']:
-                summary[p['team']]['bye_pct'] = 100.0
+                pcts[team_idx[p['team']], bye_col] = 100.0
         
         if has_relegation:
-            relegation_teams = determine_relegation_teams(stats, playoff_teams, teams, divisions)
+            relegation_teams = determine_relegation_teams(stats, playoff_teams, teams, divisions, team_to_div)
             relegation_names = [r['team'] for r in relegation_teams]
             for r in relegation_teams:
-                summary[r['team']]['relegation_pct'] = 100.0
+                pcts[team_idx[r['team']], releg_col] = 100.0
         else:
             relegation_names = []
         
         for team in teams:
             if team not in playoff_names and team not in relegation_names:
-                summary[team]['safe_pct'] = 100.0
+                pcts[team_idx[team], safe_col] = 100.0
     else:
-        for results in product([0, 1], repeat=num_games):
-            scenario_prob = 1.0
-            for i, result in enumerate(results):
-                scenario_prob *= game_probs[i][result]
-            
-            total_prob += scenario_prob
-            
-            selections = {}
-            for i, (away, home) in enumerate(matchup_list):
-                game_id = f"{away}_at_{home}".replace("'", "").replace(" ", "_")
-                winner = 'away' if results[i] == 0 else 'home'
-                selections[game_id] = {'winner': winner, 'margin': 5}
-            
-            new_stats, h2h_override = simulate_week14_outcome(stats, selections, matchups, divisions, league_name)
-            playoff_teams = determine_playoff_teams(new_stats, teams, divisions, h2h_override)
-            
-            playoff_names = [p['team'] for p in playoff_teams]
-            
-            if has_relegation:
-                relegation_teams = determine_relegation_teams(new_stats, playoff_teams, teams, divisions)
-                relegation_names = [r['team'] for r in relegation_teams]
+        num_live = sum(1 for away_prob, home_prob in game_probs if away_prob and home_prob)
+        num_scenarios = 1 << num_live
+        workers = os.cpu_count() or 1
+        
+        if num_live > _EXACT_MAX_LIVE_GAMES:
+            # Too many outcomes to enumerate; sample them instead
+            seeds = np.random.SeedSequence(_SUMMARY_SAMPLE_SEED).spawn(_SUMMARY_SAMPLE_BATCHES)
+            batch_sizes = [
+                _SUMMARY_SAMPLES * (k + 1) // _SUMMARY_SAMPLE_BATCHES - _SUMMARY_SAMPLES * k // _SUMMARY_SAMPLE_BATCHES
+                for k in range(_SUMMARY_SAMPLE_BATCHES)
+            ]
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=min(workers, _SUMMARY_SAMPLE_BATCHES)) as pool:
+                    parts = list(pool.map(
+                        _sample_scenarios, [league_name] * _SUMMARY_SAMPLE_BATCHES, batch_sizes, seeds
+                    ))
             else:
-                relegation_names = []
-            
-            for p in playoff_teams:
-                summary[p['team']]['championship_pct'] += scenario_prob
-                if p['has_bye']:
-                    summary[p['team']]['bye_pct'] += scenario_prob
-            
-            for r in relegation_names:
-                summary[r]['relegation_pct'] += scenario_prob
-            
-            for team in teams:
-                if team not in playoff_names and team not in relegation_names:
-                    summary[team]['safe_pct'] += scenario_prob
+                parts = [_sample_scenarios(league_name, n, seed) for n, seed in zip(batch_sizes, seeds)]
+        elif num_scenarios >= _PARALLEL_MIN_SCENARIOS and workers > 1:
+            # Scenarios are independent, so split the enumeration into one
+            # contiguous range per worker and add up the partial sums
+            bounds = [num_scenarios * k // workers for k in range(workers + 1)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(
+                    _accumulate_scenarios, [league_name] * workers, bounds[:-1], bounds[1:]
+                ))
+        else:
+            parts = [_accumulate_scenarios(league_name, 0, num_scenarios)]
         
-        # Convert to percentages
-        for team in teams:
-            if total_prob > 0:
-                summary[team]['championship_pct'] = round(summary[team]['championship_pct'] / total_prob * 100, 1)
-                summary[team]['bye_pct'] = round(summary[team]['bye_pct'] / total_prob * 100, 1)
-                summary[team]['relegation_pct'] = round(summary[team]['relegation_pct'] / total_prob * 100, 1)
-                summary[team]['safe_pct'] = round(summary[team]['safe_pct'] / total_prob * 100, 1)
-    
-    # Set status
-    for team in teams:
-        if summary[team]['championship_pct'] >= 99.9:
-            summary[team]['status'] = 'clinched_playoffs'
-        elif summary[team]['relegation_pct'] >= 99.9:
-            summary[team]['status'] = 'clinched_relegation'
-        elif summary[team]['safe_pct'] >= 99.9:
-            summary[team]['status'] = 'safe'
-        elif summary[team]['championship_pct'] > 0:
-            summary[team]['status'] = 'playoff_contender'
-        elif summary[team]['relegation_pct'] > 0:
-            summary[team]['status'] = 'relegation_danger'
+        # Merge the partial sums as one (teams x fields) array, in teams order
+        totals = np.zeros((len(teams), len(_SUMMARY_FIELDS)))
+        for part_prob, part_sums in parts:
+            total_prob += part_prob
+            totals += np.array([part_sums[team] for team in teams])
+        
+        # Convert to percentages; Python's round keeps the displayed values
+        # correctly rounded
+        if total_prob > 0:
+            totals = totals / total_prob * 100
+            pcts = np.array([[round(value, 1) for value in values] for values in totals.tolist()])
         else:
-            summary[team]['status'] = 'safe'
+            pcts = totals
+    
+    # Set status: first matching condition wins, otherwise safe
+    champ, releg, safe = pcts[:, champ_col], pcts[:, releg_col], pcts[:, safe_col]
+    status_codes = np.select(
+        [champ >= 99.9, releg >= 99.9, safe >= 99.9, champ > 0, releg > 0], [0, 2, 4, 1, 3], default=4
+    )
     
-    return summary
+    return {team: {
+        'current_record': stats[team]['record_str'],
+        'division': team_to_div[team],
+        **dict(zip(_SUMMARY_FIELDS, values)),
+        'status': _STATUSES[code],
+    } for team, values, code in zip(teams, pcts.tolist(), status_codes.tolist())}
 
 
-@app.route('/')
-def index():
+def warm_caches():
+    """
+    Run every league's weighted summary once so get_team_summary_weighted
+    serves it from its cache. Leagues enumerated serially also leave every
+    Week 14 outcome in the standings memo; parallel and sampled leagues run
+    in pool processes, so their memo still fills per scenario request.
+    Called from gunicorn's when_ready hook (see gunicorn_conf.py), not on
+    import, so importing this module never starts a process pool.
+    """
+    for league_name in ALL_LEAGUES:
+        get_team_summary_weighted(league_name)
+
+
+def _build_index_leagues_data():
+    """Matchup cards for the index page; inputs never change after load."""
     leagues_data = {}
     
     for league_name, league_info in ALL_LEAGUES.items():
         stats = league_info['stats']
         divisions = league_info['divisions']
-        matchup_probs = league_info.get('matchup_probs', {})
         
         matchups = []
-        for m in league_info['week14_matchups']:
-            away = m['away_team']
-            home = m['home_team']
-            game_id = f"{away}_at_{home}".replace("'", "").replace(" ", "_")
-            
-            away_win_pct = get_matchup_win_probability(away, home, matchup_probs)
-            home_win_pct = 1 - away_win_pct
-            
-            favored = 'away' if away_win_pct > home_win_pct else 'home'
-            
+        for m, (away, home, is_div, game_id) in zip(league_info['week14_matchups'], MATCHUP_GAME_IDS[league_name]):
             has_margin_impact = (league_name == 'FFPL' and away == 'The ReBiggulators' and home == 'Los Pollos Hermanos')
             margin_note = "Margin affects division title (ReBigs need 3+ to win Div W)" if has_margin_impact else ""
             
             matchups.append({
                 'game_id': game_id,
                 'away_team': away,
-                'away_record': f"{stats[away]['wins']}-{stats[away]['losses']}",
-                'away_win_pct': round(away_win_pct * 100, 1),
+                'away_record': stats[away]['record_str'],
+                'away_win_pct': round(m['away_win_pct'] * 100, 1),
                 'home_team': home,
-                'home_record': f"{stats[home]['wins']}-{stats[home]['losses']}",
-                'home_win_pct': round(home_win_pct * 100, 1),
-                'is_division_game': m['is_division_game'],
+                'home_record': stats[home]['record_str'],
+                'home_win_pct': round(m['home_win_pct'] * 100, 1),
+                'is_division_game': is_div,
                 'has_margin_impact': has_margin_impact,
                 'margin_note': margin_note,
-                'favored': favored,
+                'favored': m['favored'],
             })
         
         leagues_data[league_name] = {
@@ -885,131 +1420,193 @@ def index():
             'league_id': league_info['league_id'],
         }
     
-    return render_template('index.html', leagues=leagues_data)
+    return leagues_data
+
+
+INDEX_LEAGUES_DATA = _build_index_leagues_data()
+
+
+# The page only depends on load-time data, so it is rendered once from the
+# compiled template; the ETag is a content hash so every worker process
+# agrees on it
+_INDEX_TEMPLATE = app.jinja_env.get_template('index.html')
+_INDEX_HTML = _INDEX_TEMPLATE.render(leagues=INDEX_LEAGUES_DATA)
+_INDEX_ETAG = hashlib.sha1(_INDEX_HTML.encode('utf-8')).hexdigest()
+
+
+@app.route('/')
+def index():
+    response = app.make_response(_INDEX_HTML)
+    response.set_etag(_INDEX_ETAG)
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response.make_conditional(request)
+
+
+# Response bodies of /api/scenario keyed by (league, resolved selections).
+# Misses are admitted at _SCENARIO_ADMIT_RATE through an accumulator (every
+# other miss at 0.5), so one-off picks don't fill the cache; it is also
+# capped, since margins make the key space open-ended.
+_SCENARIO_CACHE = {}
+_SCENARIO_CACHE_MAX = 4096
+_SCENARIO_ADMIT_RATE = 0.5
+_scenario_admit_acc = 0.0
 
 
 @app.route('/api/scenario/<league_name>', methods=['POST'])
 def calculate_scenario(league_name):
     """Calculate playoff picture based on selected outcomes."""
+    global _scenario_admit_acc
     if league_name not in ALL_LEAGUES:
-        return jsonify({'error': 'Unknown league'}), 404
+        return _json({'error': 'Unknown league'}), 404
     
     league_data = ALL_LEAGUES[league_name]
     selections = request.json.get('selections', {})
     
+    cache_key = (league_name, tuple(resolve_selections(MATCHUP_GAME_IDS[league_name], selections)))
+    payload = _SCENARIO_CACHE.get(cache_key)
+    if payload is not None:
+        return _json_bytes(payload)
+    
     stats = league_data['stats']
     teams = league_data['teams']
     divisions = league_data['divisions']
     matchups = league_data['week14_matchups']
     has_relegation = league_data['has_relegation']
+    team_to_div = TEAM_DIVISION[league_name]
     
     new_stats, h2h_override = simulate_week14_outcome(stats, selections, matchups, divisions, league_name)
-    playoff_teams = determine_playoff_teams(new_stats, teams, divisions, h2h_override)
-    
-    if has_relegation:
-        relegation_teams = determine_relegation_teams(new_stats, playoff_teams, teams, divisions)
-    else:
-        relegation_teams = []
+    # Shares the standings memo with the summary enumeration; the cached
+    # lists are only read from here on
+    playoff_teams, relegation_teams = evaluate_standings(
+        league_name, new_stats, teams, divisions, matchups, has_relegation, h2h_override
+    )
     
-    playoff_names = [p['team'] for p in playoff_teams]
-    relegation_names = [r['team'] for r in relegation_teams]
-    safe_teams = []
-    for team in teams:
-        if team not in playoff_names and team not in relegation_names:
-            safe_teams.append({
-                'team': team,
-                'record': f"{new_stats[team]['wins']}-{new_stats[team]['losses']}",
-                'division': get_team_division(team, divisions)
-            })
+    placed = {p['team'] for p in playoff_teams}
+    placed.update(r['team'] for r in relegation_teams)
+    safe_teams = [
+        {'team': team, 'record': new_stats[team]['record_str'], 'division': team_to_div[team]}
+        for team in teams if team not in placed
+    ]
     
-    return jsonify({
+    response = _json({
         'playoff_teams': playoff_teams,
         'relegation_teams': relegation_teams,
         'safe_teams': safe_teams,
         'has_relegation': has_relegation,
     })
+    
+    _scenario_admit_acc += _SCENARIO_ADMIT_RATE
+    if _scenario_admit_acc >= 1.0:
+        _scenario_admit_acc -= 1.0
+        if len(_SCENARIO_CACHE) < _SCENARIO_CACHE_MAX:
+            _SCENARIO_CACHE[cache_key] = response.get_data()
+    
+    return response
+
+
+def _build_monte_carlo_summary_rows(league_name):
+    """/api/summary team rows from the Monte Carlo results, sorted best first."""
+    league_info = ALL_LEAGUES[league_name]
+    teams = league_info['teams']
+    stats = league_info['stats']
+    has_relegation = league_info['has_relegation']
+    team_to_div = TEAM_DIVISION[league_name]
+    mc_results = MONTE_CARLO_RESULTS[league_name]['team_results']
+    
+    mcs = [mc_results.get(team, {}) for team in teams]
+    playoff_pcts = [mc.get('playoff_pct', 0) for mc in mcs]
+    relegation_pcts = [mc.get('relegation_pct', 0) if has_relegation else 0 for mc in mcs]
+    
+    playoff = np.array(playoff_pcts, dtype=np.float64)
+    releg = np.array(relegation_pcts, dtype=np.float64)
+    status_codes = np.select(
+        [playoff >= 99.9, playoff > 0, releg >= 99.9, releg > 0], [0, 1, 2, 3], default=4
+    )
+    # Most likely playoff team first, then least relegation risk; lexsort is
+    # stable, so equal teams stay in league order
+    order = np.lexsort((releg, -playoff))
+    
+    rows = []
+    for i in order.tolist():
+        team = teams[i]
+        mc = mcs[i]
+        rows.append({
+            'team': team,
+            'current_record': stats[team]['record_str'],
+            'division': team_to_div[team],
+            'championship_pct': playoff_pcts[i],
+            'bye_pct': mc.get('bye_pct', 0),
+            'relegation_pct': relegation_pcts[i],
+            'safe_pct': 100 - playoff_pcts[i] - relegation_pcts[i],
+            'seed_pcts': mc.get('seed_pcts', {}),
+            'relegation_seed_pcts': mc.get('relegation_seed_pcts', {}),
+            'status': _STATUSES[status_codes[i]],
+            'use_monte_carlo': True,
+        })
+    return rows
 
 
 @app.route('/api/summary/<league_name>')
 def team_summary(league_name):
     """Get summary of playoff situations for all teams in a league."""
     if league_name not in ALL_LEAGUES:
-        return jsonify({'error': 'Unknown league'}), 404
-    
+        return _json({'error': 'Unknown league'}), 404
+    
+    payload = _SUMMARY_CACHE.get(league_name)
+    if payload is None:
+        # Weighted fallback leagues are summarized on first request
+        payload = _SUMMARY_CACHE[league_name] = _dumps(_build_summary(league_name))
+        _SUMMARY_CACHE_BR[league_name] = _brotli(payload)
+    return _json_bytes(payload, _SUMMARY_CACHE_BR[league_name])
+
+
+def _build_summary(league_name):
+    """Response body for /api/summary."""
     teams = ALL_LEAGUES[league_name]['teams']
-    stats = ALL_LEAGUES[league_name]['stats']
-    divisions = ALL_LEAGUES[league_name]['divisions']
     has_relegation = ALL_LEAGUES[league_name]['has_relegation']
     
     # Use Monte Carlo results if available for this league
     if league_name in MONTE_CARLO_RESULTS:
         mc_data = MONTE_CARLO_RESULTS[league_name]
-        mc_results = mc_data['team_results']
-        result = []
-        for team in teams:
-            mc = mc_results.get(team, {})
-            playoff_pct = mc.get('playoff_pct', 0)
-            relegation_pct = mc.get('relegation_pct', 0) if has_relegation else 0
-            
-            # Determine status
-            if playoff_pct >= 99.9:
-                status = 'clinched_playoffs'
-            elif playoff_pct > 0:
-                status = 'playoff_contender'
-            elif relegation_pct >= 99.9:
-                status = 'clinched_relegation'
-            elif relegation_pct > 0:
-                status = 'relegation_danger'
-            else:
-                status = 'safe'
-            
-            result.append({
-                'team': team,
-                'current_record': f"{stats[team]['wins']}-{stats[team]['losses']}",
-                'division': get_team_division(team, divisions),
-                'championship_pct': playoff_pct,
-                'bye_pct': mc.get('bye_pct', 0),
-                'relegation_pct': relegation_pct,
-                'safe_pct': 100 - playoff_pct - relegation_pct,
-                'seed_pcts': mc.get('seed_pcts', {}),
-                'relegation_seed_pcts': mc.get('relegation_seed_pcts', {}),
-                'status': status,
-                'use_monte_carlo': True,
-            })
-        
-        result.sort(key=lambda t: (-t['championship_pct'], t['relegation_pct']))
-        return jsonify({
-            'teams': result,
+        return {
+            'teams': _build_monte_carlo_summary_rows(league_name),
             'has_relegation': has_relegation,
             'monte_carlo': True,
             'n_simulations': mc_data.get('n_simulations', 0),
-        })
+        }
     
     # Fall back to weighted probability calculation
     summary = get_team_summary_weighted(league_name)
     
-    sorted_teams = sorted(
-        teams,
-        key=lambda t: (-summary[t]['championship_pct'], summary[t]['relegation_pct'])
-    )
+    # Stable, so equal teams stay in league order
+    order = np.lexsort((
+        [summary[t]['relegation_pct'] for t in teams],
+        [-summary[t]['championship_pct'] for t in teams],
+    ))
+    sorted_teams = [teams[i] for i in order.tolist()]
     
     result = [{**summary[team], 'team': team, 'use_monte_carlo': False} for team in sorted_teams]
-    return jsonify({
+    return {
         'teams': result,
         'has_relegation': has_relegation,
         'monte_carlo': False,
-    })
+    }
 
 
 @app.route('/api/team-summaries/<league_name>')
 def get_team_summaries(league_name):
     """Return pre-written team playoff scenario summaries."""
     if league_name not in ALL_LEAGUES:
-        return jsonify({'error': 'Unknown league'}), 404
+        return _json({'error': 'Unknown league'}), 404
     
     if league_name not in TEAM_SUMMARIES:
-        return jsonify({'error': 'No summaries available for this league'}), 404
+        return _json({'error': 'No summaries available for this league'}), 404
     
+    return _json_bytes(_TEAM_SUMMARIES_CACHE[league_name], _TEAM_SUMMARIES_CACHE_BR[league_name])
+
+
+def _build_team_summaries(league_name):
+    """Response body for /api/team-summaries."""
     # Get team data for ordering and stats
     mc_data = MONTE_CARLO_RESULTS.get(league_name, {})
     mc_results = mc_data.get('team_results', {})
@@ -1031,11 +1628,31 @@ def get_team_summaries(league_name):
     # Sort by playoff probability descending, then relegation ascending
     result.sort(key=lambda t: (-t['playoff_pct'], t['relegation_pct']))
     
-    return jsonify({
+    return {
         'summaries': result,
         'league': league_name,
-    })
+    }
+
+
+# Monte Carlo results, summaries and standings never change after load, so
+# these responses are serialized once up front
+_SUMMARY_CACHE = {
+    league_name: _dumps(_build_summary(league_name))
+    for league_name in MONTE_CARLO_RESULTS
+    if league_name in ALL_LEAGUES
+}
+_TEAM_SUMMARIES_CACHE = {
+    league_name: _dumps(_build_team_summaries(league_name))
+    for league_name in TEAM_SUMMARIES
+    if league_name in ALL_LEAGUES
+}
+
+# Compressed once at the highest brotli quality rather than per request
+_SUMMARY_CACHE_BR = {league_name: _brotli(payload) for league_name, payload in _SUMMARY_CACHE.items()}
+_TEAM_SUMMARIES_CACHE_BR = {league_name: _brotli(payload) for league_name, payload in _TEAM_SUMMARIES_CACHE.items()}
 
 
-if __name__ == '__main__':
+# Production serves through gunicorn (gunicorn -c gunicorn_conf.py app:app);
+# the Werkzeug dev server is for local debugging only
+if __name__ == '__main__' and os.getenv('FLASK_DEBUG'):
     app.run(debug=True, host='0.0.0.0', port=5000)
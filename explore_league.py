@@ -4,8 +4,12 @@ Explore the Dougin FFL website structure to find data needed for playoff scenari
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration
 BASE_URL = "https://www.dougin.com/ffl"
@@ -23,10 +27,34 @@ HEADERS = {
     'Connection': 'keep-alive',
 }
 
+_RE_NEWLINES = re.compile(r'\n+')
+_RE_SPACES = re.compile(r' +')
+# Matches link text naming one of the league's teams
+_TEAM_RE = re.compile(r'boomie|hampden|mobius|direction|gorilla|pollos|rebig|ytterby|shore|nip|lester|original|sith', re.IGNORECASE)
+
+_PRINT_LOCK = threading.Lock()
+
+# explore_page only reports the title, table count and a 3000-character
+# preview, so it stops downloading a page after this many bytes
+_PREVIEW_BYTES = 65536
+
+POWER_MATRIX_URL = f"{BASE_URL}/FFL.cfm?Matrix=1&League=3"
+POWER_MATRIX_ALT_URL = f"{BASE_URL}/ffl.cfm?Matrix=1&League=3"
+SCHEDULE_URL = f"{BASE_URL}/FFL.cfm?FID=LeagueSchedule.cfm&League=3"
+
+def clean_text(text):
+    """Collapse runs of newlines and spaces in page text."""
+    text = _RE_NEWLINES.sub('\n', text)
+    return _RE_SPACES.sub(' ', text)
+
 def create_session():
     """Create an authenticated session."""
     session = requests.Session()
     session.headers.update(HEADERS)
+    # Keep-alive pool large enough for the concurrent fetches in main()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
     
     # First, get the login page to establish session
     print("Establishing session...")
@@ -74,7 +102,35 @@ def create_session():
     
     return session
 
-def explore_page(session, url, description, show_full=False):
+def fetch_pages(session, urls, stream_urls=()):
+    """
+    Fetch several pages concurrently; returns {url: response}. Pages in
+    stream_urls are requested with stream=True, so only their headers are
+    read here and the caller decides how much of the body to download.
+    """
+    def fetch(url):
+        try:
+            resp = session.get(url, timeout=10, stream=url in stream_urls)
+        except requests.RequestException as e:
+            # Left out of the result; the page is retried when it is explored
+            with _PRINT_LOCK:
+                print(f"  Failed {url}: {e}")
+            return None
+        with _PRINT_LOCK:
+            print(f"  Fetched {url}: {resp.status_code}")
+        return resp
+    
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        responses = list(ex.map(fetch, urls))
+    return {url: resp for url, resp in zip(urls, responses) if resp is not None}
+
+def get_page(session, url, pages=None, stream=False):
+    """Return the prefetched response for url, or fetch it now."""
+    if pages and url in pages:
+        return pages[url]
+    return session.get(url, timeout=10, stream=stream)
+
+def explore_page(session, url, description, show_full=False, pages=None):
     """Fetch and analyze a page."""
     print(f"\n{'='*60}")
     print(f"Exploring: {description}")
@@ -82,53 +138,64 @@ def explore_page(session, url, description, show_full=False):
     print('='*60)
     
     try:
-        resp = session.get(url, timeout=10)
-        soup = BeautifulSoup(resp.text, 'html.parser')
+        resp = get_page(session, url, pages, stream=True)
         
-        print(f"Status: {resp.status_code}, Length: {len(resp.text)} bytes")
+        # Parse the body as it arrives and stop once the preview is covered
+        parser = lxml.html.HTMLParser()
+        length = 0
+        try:
+            for chunk in resp.iter_content(8192):
+                parser.feed(chunk)
+                length += len(chunk)
+                if length >= _PREVIEW_BYTES:
+                    break
+        finally:
+            resp.close()
+        page = parser.close()
+        page_text = page.text_content()
+        
+        truncated = " (truncated)" if length >= _PREVIEW_BYTES else ""
+        print(f"Status: {resp.status_code}, Length: {length} bytes{truncated}")
         
         # Check for errors
-        if 'Error Occurred' in resp.text:
+        if 'Error Occurred' in page_text:
             print("⚠ Page contains error messages")
             return None
         
         # Get title
-        title = soup.find('title')
+        title = page.findtext('.//title')
         if title:
-            print(f"Title: {title.text.strip()}")
+            print(f"Title: {title.strip()}")
         
         # Find tables (most league data is in tables)
-        tables = soup.find_all('table')
+        tables = page.findall('.//table')
         print(f"Tables found: {len(tables)}")
         
         if show_full:
             print("\nFull page text preview:")
             print("-" * 40)
-            text = soup.get_text()
             # Clean up whitespace
-            text = re.sub(r'\n+', '\n', text)
-            text = re.sub(r' +', ' ', text)
+            text = clean_text(page_text)
             print(text[:3000])
         
-        return soup
+        return page
         
     except Exception as e:
         print(f"Error: {e}")
         return None
 
-def explore_all_links(session):
+def explore_all_links(session, pages=None):
     """Get all links from the main page."""
     print("\n" + "#"*60)
     print("# ALL AVAILABLE LINKS FROM MAIN PAGE")
     print("#"*60)
     
-    resp = session.get(LEAGUE_URL, timeout=10)
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    resp = get_page(session, LEAGUE_URL, pages)
+    soup = BeautifulSoup(resp.content, 'lxml', parse_only=SoupStrainer('a'))
     
-    links = soup.find_all('a')
     seen = set()
     
-    for link in links:
+    for link in soup.find_all('a'):
         href = link.get('href', '')
         text = link.get_text(strip=True)
         
@@ -136,35 +203,30 @@ def explore_all_links(session):
             seen.add(href)
             print(f"  {text[:35]:35} -> {href[:60]}")
 
-def get_power_matrix(session):
+def get_power_matrix(session, pages=None):
     """Get the Power Matrix which contains standings."""
     print("\n" + "#"*60)
     print("# POWER MATRIX (STANDINGS)")
     print("#"*60)
     
-    url = f"{BASE_URL}/FFL.cfm?Matrix=1&League=3"
-    soup = explore_page(session, url, "Power Matrix", show_full=True)
+    page = explore_page(session, POWER_MATRIX_URL, "Power Matrix", show_full=True, pages=pages)
     
-    if soup:
+    if page is not None:
         # Also try with explicit league parameter
-        url2 = f"{BASE_URL}/ffl.cfm?Matrix=1&League=3"
-        resp = session.get(url2, timeout=10)
+        resp = get_page(session, POWER_MATRIX_ALT_URL, pages)
         if 'Error' not in resp.text:
             print("\n\nAlternate URL worked!")
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            text = soup.get_text()
-            text = re.sub(r'\n+', '\n', text)
-            text = re.sub(r' +', ' ', text)
+            soup = BeautifulSoup(resp.content, 'lxml', parse_only=SoupStrainer(['table', 'title']))
+            text = clean_text(soup.get_text())
             print(text[:3000])
 
-def get_league_schedule(session):
+def get_league_schedule(session, pages=None):
     """Get the full league schedule."""
     print("\n" + "#"*60)
     print("# LEAGUE SCHEDULE")
     print("#"*60)
     
-    url = f"{BASE_URL}/FFL.cfm?FID=LeagueSchedule.cfm&League=3"
-    soup = explore_page(session, url, "League Schedule", show_full=True)
+    explore_page(session, SCHEDULE_URL, "League Schedule", show_full=True, pages=pages)
 
 def get_team_rosters(session):
     """Get team roster info."""
@@ -173,23 +235,20 @@ def get_team_rosters(session):
     print("#"*60)
     
     url = f"{BASE_URL}/LeagueRoster.cfm?League=3"
-    soup = explore_page(session, url, "Team Rosters", show_full=True)
+    explore_page(session, url, "Team Rosters", show_full=True)
 
-def get_home_page_content(session):
+def get_home_page_content(session, pages=None):
     """Get the main home page content including recent standings."""
     print("\n" + "#"*60)
     print("# HOME PAGE CONTENT")
     print("#"*60)
     
-    resp = session.get(LEAGUE_URL, timeout=10)
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    resp = get_page(session, LEAGUE_URL, pages)
     
     print(f"Status: {resp.status_code}")
     
     # Get all text content
-    text = soup.get_text()
-    text = re.sub(r'\n+', '\n', text)
-    text = re.sub(r' +', ' ', text)
+    text = clean_text(lxml.html.fromstring(resp.content).text_content())
     
     print("\nPage content:")
     print("-" * 40)
@@ -198,10 +257,11 @@ def get_home_page_content(session):
     # Look for team links specifically
     print("\n\nTeam Links:")
     print("-" * 40)
+    soup = BeautifulSoup(resp.content, 'lxml', parse_only=SoupStrainer('a'))
     for link in soup.find_all('a'):
         href = link.get('href', '')
         text = link.get_text(strip=True)
-        if any(team in text.lower() for team in ['boomie', 'hampden', 'mobius', 'direction', 'gorilla', 'pollos', 'rebig', 'ytterby', 'shore', 'nip', 'lester', 'original', 'sith']):
+        if _TEAM_RE.search(text):
             print(f"  {text} -> {href}")
 
 def main():
@@ -211,17 +271,25 @@ def main():
     
     session = create_session()
     
+    # The pages are independent, so fetch them all at once and report in order
+    print("\nFetching pages...")
+    pages = fetch_pages(
+        session,
+        [LEAGUE_URL, POWER_MATRIX_URL, POWER_MATRIX_ALT_URL, SCHEDULE_URL],
+        stream_urls={POWER_MATRIX_URL, SCHEDULE_URL},
+    )
+    
     # Get home page content first
-    get_home_page_content(session)
+    get_home_page_content(session, pages)
     
     # Explore all available links
-    explore_all_links(session)
+    explore_all_links(session, pages)
     
     # Get Power Matrix (standings)
-    get_power_matrix(session)
+    get_power_matrix(session, pages)
     
     # Get schedule
-    get_league_schedule(session)
+    get_league_schedule(session, pages)
 
 if __name__ == "__main__":
     main()
@@ -3,17 +3,30 @@
 Fetch data for all 3 Walker FFL leagues: WFFL, DFFL, FFPL
 """
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
-import json
+import orjson
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from ffl_http import SESSION
 
 BASE_URL = "https://www.dougin.com/ffl"
 
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-}
+# Patterns applied to every link and table cell while parsing
+_MAIN_MENU_RE = re.compile(r'mainMenu\(0,\d+\)')
+_RANK_RE = re.compile(r'^(\d+)\.$')
+_PLAYED_RE = re.compile(r'(.+?)\s*\((\d+)\)\s*at\s*(.+?)\s*\((\d+)\)')
+_UNPLAYED_RE = re.compile(r'(.+?)\s+at\s+(.+?)$')
+_SCORE_PARENS_RE = re.compile(r'\(\d+\)')
+_RECORD_RE = re.compile(r'^(\d+)-(\d+)(?:-(\d+))?$')
+_WEEK14_RE = re.compile(r'\bWeek\s*14\b')
+
+# Only build the parts of each page the parsers read; headers, scripts and
+# everything outside the tables are dropped while parsing
+_MENU_STRAINER = SoupStrainer('a', onclick=True)
+_ROWS_AND_LINKS_STRAINER = SoupStrainer(['tr', 'a'])
+_ROWS_STRAINER = SoupStrainer('tr')
 
 LEAGUES = {
     'WFFL': {'id': 1, 'has_relegation': False},
@@ -22,25 +35,58 @@ LEAGUES = {
 }
 
 
+def _new_h2h():
+    """Empty head-to-head record against one opponent."""
+    return {'wins': 0, 'losses': 0, 'ties': 0, 'points_for': 0, 'points_against': 0}
+
+
+# The site writes apostrophes in team names as backticks
+_APOS_TRANS = str.maketrans({'`': "'"})
+
+
 def normalize_team_name(name):
     """Normalize team name by cleaning up special characters."""
-    return name.strip().replace('`', "'")
+    return name.strip().translate(_APOS_TRANS)
+
+
+def standings_url(league_id):
+    return f"{BASE_URL}/FFL.cfm?Matrix=1&League={league_id}"
+
+
+def schedule_url(league_id):
+    return f"{BASE_URL}/FFL.cfm?FID=LeagueSchedule.cfm&League={league_id}"
+
+
+def matrix_probs_url(league_id):
+    return f"{BASE_URL}/FFL.cfm?FID=Matrix.cfm&MatID=3&League={league_id}"
+
+
+def fetch_pages(urls):
+    """Fetch pages concurrently; returns {url: body bytes}, each distinct URL fetched once."""
+    urls = list(dict.fromkeys(urls))
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        bodies = list(ex.map(lambda url: SESSION.get(url, timeout=10).content, urls))
+    return dict(zip(urls, bodies))
+
+
+def get_page(url, pages=None):
+    """Body of url from prefetched pages, or fetched now."""
+    if pages and url in pages:
+        return pages[url]
+    return SESSION.get(url, timeout=10).content
 
 
 def get_teams_and_divisions(league_id):
     """Get team names and division assignments from the standings page."""
-    session = requests.Session()
-    session.headers.update(HEADERS)
-    
     url = f"{BASE_URL}/FFL.cfm?League={league_id}"
-    resp = session.get(url, timeout=10)
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    resp = SESSION.get(url, timeout=10)
+    soup = BeautifulSoup(resp.content, 'lxml', parse_only=_MENU_STRAINER)
     
     teams = []
     divisions = {'O': [], 'W': [], 'D': []}
     
     # Find team links in the menu
-    team_menu = soup.find_all('a', onclick=re.compile(r'mainMenu\(0,\d+\)'))
+    team_menu = soup.find_all('a', onclick=_MAIN_MENU_RE)
     for link in team_menu:
         team_name = normalize_team_name(link.get_text(strip=True))
         if team_name and team_name != 'Sith Lords':  # Skip inactive teams
@@ -49,93 +95,100 @@ def get_teams_and_divisions(league_id):
     return teams, divisions
 
 
-def get_standings_and_divisions(league_id):
-    """Get current standings with division info from the Power Matrix page."""
-    session = requests.Session()
-    session.headers.update(HEADERS)
-    
-    url = f"{BASE_URL}/FFL.cfm?Matrix=1&League={league_id}"
-    resp = session.get(url, timeout=10)
-    soup = BeautifulSoup(resp.text, 'html.parser')
+def get_standings_divisions_and_ranks(league_id, pages=None):
+    """
+    Get current standings with division info and each team's matrix rank
+    from the Power Matrix page.
+    """
+    soup = BeautifulSoup(get_page(standings_url(league_id), pages), 'lxml', parse_only=_ROWS_AND_LINKS_STRAINER)
     
     teams = []
     divisions = {}  # Dynamically populated
     stats = {}
-    matrix_ranks = {}
+    # Matrix ranks as printed ("3.") in a row's first cell
+    listed_ranks = {}
     
-    # Find the standings table rows
-    rows = soup.find_all('tr')
+    # Only rows holding a team link matter, so start from the links (one
+    # CSS scan) and step up to each row; a row's first link names its team
     rank = 0
+    seen_rows = set()
     
-    for row in rows:
+    for team_link in soup.select('a.base_link2'):
+        row = team_link.find_parent('tr')
+        if row is None or id(row) in seen_rows:
+            continue
+        seen_rows.add(id(row))
         cells = row.find_all(['td', 'th'])
+        team_name = normalize_team_name(team_link.get_text(strip=True))
+        
+        if len(cells) >= 2:
+            # Look for rank number in first cell
+            rank_match = _RANK_RE.match(cells[0].get_text(strip=True))
+            if rank_match:
+                listed_ranks[team_name] = int(rank_match.group(1))
+        
         if len(cells) >= 10:
-            # Look for rows with team links
-            team_link = row.find('a', class_='base_link2')
-            if team_link:
-                rank += 1
-                team_name = normalize_team_name(team_link.get_text(strip=True))
-                
-                # Find division cell - single letter cell (O, W, D, S, H, etc.)
-                div_cell = None
-                for i, cell in enumerate(cells):
-                    text = cell.get_text(strip=True)
-                    # Division is a single uppercase letter
-                    if len(text) == 1 and text.isupper():
-                        div_cell = text
-                        break
+            rank += 1
+            
+            # Find division cell - single letter cell (O, W, D, S, H, etc.)
+            div_cell = None
+            for i, cell in enumerate(cells):
+                text = cell.get_text(strip=True)
+                # Division is a single uppercase letter
+                if len(text) == 1 and text.isupper():
+                    div_cell = text
+                    break
+            
+            if team_name and team_name not in teams:
+                teams.append(team_name)
+                if div_cell:
+                    if div_cell not in divisions:
+                        divisions[div_cell] = []
+                    if team_name not in divisions[div_cell]:
+                        divisions[div_cell].append(team_name)
                 
-                if team_name and team_name not in teams:
-                    teams.append(team_name)
-                    if div_cell:
-                        if div_cell not in divisions:
-                            divisions[div_cell] = []
-                        if team_name not in divisions[div_cell]:
-                            divisions[div_cell].append(team_name)
-                    matrix_ranks[team_name] = rank
-                    
-                    # Initialize stats (will be filled from schedule)
-                    stats[team_name] = {
-                        'wins': 0, 'losses': 0, 'ties': 0,
-                        'division_wins': 0, 'division_losses': 0, 'division_ties': 0,
-                        'points_for': 0, 'points_against': 0,
-                        'matrix_rank': rank,
-                        'h2h': defaultdict(lambda: {'wins': 0, 'losses': 0, 'ties': 0, 'points_for': 0, 'points_against': 0})
-                    }
+                # Initialize stats (will be filled from schedule)
+                stats[team_name] = {
+                    'wins': 0, 'losses': 0, 'ties': 0,
+                    'division_wins': 0, 'division_losses': 0, 'division_ties': 0,
+                    'points_for': 0, 'points_against': 0,
+                    'matrix_rank': rank,
+                    # Filled in as games are read; opponents never played get no entry
+                    # (app.py and monte_carlo.py add empty records on load)
+                    'h2h': defaultdict(_new_h2h)
+                }
+    
+    matrix_ranks = {team_name: listed_rank for team_name, listed_rank in listed_ranks.items() if team_name in stats}
     
     return teams, divisions, stats, matrix_ranks
 
 
-def get_schedule_and_stats(league_id, teams, divisions):
-    """Get full schedule and calculate stats from game results."""
-    session = requests.Session()
-    session.headers.update(HEADERS)
-    
-    url = f"{BASE_URL}/FFL.cfm?FID=LeagueSchedule.cfm&League={league_id}"
-    resp = session.get(url, timeout=10)
-    soup = BeautifulSoup(resp.text, 'html.parser')
-    
-    stats = {team: {
-        'wins': 0, 'losses': 0, 'ties': 0,
-        'division_wins': 0, 'division_losses': 0, 'division_ties': 0,
-        'points_for': 0, 'points_against': 0,
-        'matrix_rank': 0,
-        'h2h': {opp: {'wins': 0, 'losses': 0, 'ties': 0, 'points_for': 0, 'points_against': 0} 
-                for opp in teams if opp != team}
-    } for team in teams}
+def get_schedule_and_stats(league_id, teams, divisions, stats, pages=None, matrix_ranks=None):
+    """
+    Get full schedule and calculate stats from game results, filling in the
+    zeroed stats built from the standings page.
+    """
+    matrix_ranks = matrix_ranks or {}
+    teams_set = frozenset(teams)
+    team_to_div = {t: d for d, ts in divisions.items() for t in ts}
+    soup = BeautifulSoup(get_page(schedule_url(league_id), pages), 'lxml', parse_only=_ROWS_AND_LINKS_STRAINER)
+    
+    # Use the ranks as listed on the Power Matrix page rather than row order
+    for team in teams:
+        stats[team]['matrix_rank'] = matrix_ranks.get(team, 0)
     
     week14_matchups = []
     played_games = []
     
     # Find all game links (played games)
-    game_links = soup.find_all('a', class_='base_link2')
+    game_links = soup.select('a.base_link2')
     
     game_count = 0
     for link in game_links:
         game_text = link.get_text(strip=True)
         
         # Pattern for played games: "Team1 (score1) at Team2 (score2)"
-        played_match = re.match(r'(.+?)\s*\((\d+)\)\s*at\s*(.+?)\s*\((\d+)\)', game_text)
+        played_match = _PLAYED_RE.match(game_text)
         
         if played_match:
             away_team = normalize_team_name(played_match.group(1))
@@ -143,18 +196,13 @@ def get_schedule_and_stats(league_id, teams, divisions):
             home_team = normalize_team_name(played_match.group(3))
             home_score = int(played_match.group(4))
             
-            if away_team in teams and home_team in teams:
+            if away_team in teams_set and home_team in teams_set:
                 game_count += 1
                 week = (game_count - 1) // 6 + 1
                 
                 # Determine division game
-                away_div = None
-                home_div = None
-                for div, div_teams in divisions.items():
-                    if away_team in div_teams:
-                        away_div = div
-                    if home_team in div_teams:
-                        home_div = div
+                away_div = team_to_div.get(away_team)
+                home_div = team_to_div.get(home_team)
                 is_div_game = away_div == home_div and away_div is not None
                 
                 played_games.append({
@@ -203,167 +251,72 @@ def get_schedule_and_stats(league_id, teams, divisions):
                 stats[home_team]['h2h'][away_team]['points_against'] += away_score
     
     # Find Week 14 matchups - these are plain text in <td> elements (not links)
-    # Look for td cells under Week 14 header
-    all_tds = soup.find_all('td', align='center')
+    # Look for td cells under Week 14 header; without one, scan every cell
+    week14_header = soup.find(string=_WEEK14_RE)
+    if week14_header is not None:
+        all_tds = week14_header.find_all_next('td', align='center')
+    else:
+        all_tds = soup.find_all('td', align='center')
+    seen_week14 = set()
     for td in all_tds:
         text = td.get_text(strip=True)
+        # Most cells are not games at all; skip them before any regex work
+        if ' at ' not in text:
+            continue
         # Unplayed games don't have score parentheses like "(35)"
         # But they may have parentheses in team names like "(university)"
-        # Check: has " at " but no pattern like "(number)"
-        if ' at ' in text and not re.search(r'\(\d+\)', text):
-            unplayed_match = re.match(r'(.+?)\s+at\s+(.+?)$', text)
-            if unplayed_match:
-                away_raw = unplayed_match.group(1).replace('`', "'").strip()
-                home_raw = unplayed_match.group(2).replace('`', "'").strip()
-                
-                # Find matching team names
-                away_team = None
-                home_team = None
-                for team in teams:
-                    if team == away_raw or team in away_raw or away_raw in team:
-                        away_team = team
-                    if team == home_raw or team in home_raw or home_raw in team:
-                        home_team = team
-                
-                if away_team and home_team and away_team in teams and home_team in teams:
-                    # Determine division game
-                    away_div = None
-                    home_div = None
-                    for div, div_teams in divisions.items():
-                        if away_team in div_teams:
-                            away_div = div
-                        if home_team in div_teams:
-                            home_div = div
-                    is_div_game = away_div == home_div and away_div is not None
-                    
-                    # Avoid duplicates
-                    if not any(m['away_team'] == away_team and m['home_team'] == home_team for m in week14_matchups):
-                        week14_matchups.append({
-                            'away_team': away_team,
-                            'home_team': home_team,
-                            'is_division_game': is_div_game
-                        })
-    
-    return stats, week14_matchups, played_games
-
-
-def get_power_matrix_probs(league_id, teams):
-    """Get detailed Power Matrix records for win probability calculation."""
-    session = requests.Session()
-    session.headers.update(HEADERS)
-    
-    url = f"{BASE_URL}/FFL.cfm?FID=Matrix.cfm&MatID=3&League={league_id}"
-    resp = session.get(url, timeout=10)
-    soup = BeautifulSoup(resp.text, 'html.parser')
-    
-    matrix = {}  # {(home_team, away_team): (home_wins, home_losses, home_ties)}
-    
-    # Find all data rows
-    all_rows = soup.find_all('tr')
-    
-    # Build column order from header
-    column_teams = []
-    for row in all_rows:
-        header_cells = row.find_all('th')
-        for cell in header_cells:
-            text = cell.get_text(strip=True)
-            # Look for abbreviation patterns (2-4 uppercase letters)
-            if re.match(r'^[A-Z][A-Za-z0-9]{1,4}$', text) and text not in ['HOME', 'Rank', 'Prev', 'Team', 'Div', 'Pct', 'Record']:
-                column_teams.append(text)
-        if len(column_teams) >= 12:
-            break
-    
-    # Now find data rows and parse records
-    for row in all_rows:
-        cells = row.find_all(['td', 'th'])
-        if len(cells) < 13:
+        if _SCORE_PARENS_RE.search(text):
             continue
+        unplayed_match = _UNPLAYED_RE.match(text)
+        if not unplayed_match:
+            continue
+        away_raw = normalize_team_name(unplayed_match.group(1))
+        home_raw = normalize_team_name(unplayed_match.group(2))
         
-        # First cell should be team name
-        first_cell_text = cells[0].get_text(strip=True)
+        # Find matching team names
+        away_team = None
         home_team = None
-        
         for team in teams:
-            if team.replace("'", "`") in first_cell_text or first_cell_text.replace("`", "'") == team:
+            if team == away_raw or team in away_raw or away_raw in team:
+                away_team = team
+            if team == home_raw or team in home_raw or home_raw in team:
                 home_team = team
-                break
         
-        if home_team is None:
-            continue
-        
-        # Parse record cells
-        for i, cell in enumerate(cells[1:13]):
-            if i >= len(column_teams):
-                break
-            
-            record_text = cell.get_text(strip=True)
-            match = re.match(r'^(\d+)-(\d+)(?:-(\d+))?$', record_text)
+        if away_team and home_team and away_team in teams_set and home_team in teams_set:
+            # Determine division game
+            away_div = team_to_div.get(away_team)
+            home_div = team_to_div.get(home_team)
+            is_div_game = away_div == home_div and away_div is not None
             
-            if match:
-                wins = int(match.group(1))
-                losses = int(match.group(2))
-                ties = int(match.group(3)) if match.group(3) else 0
-                
-                # We need to map column abbreviation to full team name
-                # For now, store with index
-                matrix[(home_team, i)] = (wins, losses, ties)
-    
-    return matrix, column_teams
-
-
-def get_matrix_ranks(league_id, teams):
-    """Get matrix ranks from the Power Matrix standings."""
-    session = requests.Session()
-    session.headers.update(HEADERS)
-    
-    url = f"{BASE_URL}/FFL.cfm?Matrix=1&League={league_id}"
-    resp = session.get(url, timeout=10)
-    soup = BeautifulSoup(resp.text, 'html.parser')
-    
-    matrix_ranks = {}
-    rows = soup.find_all('tr')
-    
-    for row in rows:
-        cells = row.find_all(['td', 'th'])
-        if len(cells) >= 2:
-            # Look for rank number in first cell
-            first_text = cells[0].get_text(strip=True)
-            rank_match = re.match(r'^(\d+)\.$', first_text)
-            
-            if rank_match:
-                rank = int(rank_match.group(1))
-                # Find team link in this row
-                team_link = row.find('a', class_='base_link2')
-                if team_link:
-                    team_name = normalize_team_name(team_link.get_text(strip=True))
-                    if team_name in teams:
-                        matrix_ranks[team_name] = rank
+            # Avoid duplicates
+            if (away_team, home_team) not in seen_week14:
+                seen_week14.add((away_team, home_team))
+                week14_matchups.append({
+                    'away_team': away_team,
+                    'home_team': home_team,
+                    'is_division_game': is_div_game
+                })
     
-    return matrix_ranks
+    return stats, week14_matchups, played_games
 
 
-def fetch_league_data(league_name, league_id):
+def fetch_league_data(league_name, league_id, pages=None):
     """Fetch all data for a single league."""
     print(f"\n{'='*60}")
     print(f"Fetching {league_name} (League {league_id})...")
     print('='*60)
     
-    # Get teams and divisions from Power Matrix page
-    print("  Getting standings and divisions...")
-    teams, divisions, _, _ = get_standings_and_divisions(league_id)
-    print(f"  Found {len(teams)} teams")
+    # Get teams, divisions and matrix ranks from Power Matrix page
+    print(f"  [{league_name}] Getting standings, divisions and Power Matrix ranks...")
+    teams, divisions, stats, matrix_ranks = get_standings_divisions_and_ranks(league_id, pages)
+    print(f"  [{league_name}] Found {len(teams)} teams")
     
     # Get schedule and calculate stats
-    print("  Getting schedule and stats...")
-    stats, week14_matchups, played_games = get_schedule_and_stats(league_id, teams, divisions)
-    print(f"  Found {len(played_games)} played games, {len(week14_matchups)} Week 14 matchups")
-    
-    # Get matrix ranks
-    print("  Getting Power Matrix ranks...")
-    matrix_ranks = get_matrix_ranks(league_id, teams)
-    for team in teams:
-        if team in matrix_ranks:
-            stats[team]['matrix_rank'] = matrix_ranks[team]
+    print(f"  [{league_name}] Getting schedule and stats...")
+    stats, week14_matchups, played_games = get_schedule_and_stats(
+        league_id, teams, divisions, stats, pages, matrix_ranks=matrix_ranks
+    )
+    print(f"  [{league_name}] Found {len(played_games)} played games, {len(week14_matchups)} Week 14 matchups")
     
     return {
         'teams': teams,
@@ -375,14 +328,12 @@ def fetch_league_data(league_name, league_id):
     }
 
 
-def fetch_matrix_probs_for_matchups(league_id, matchups, teams):
-    """Fetch Power Matrix win probabilities for Week 14 matchups."""
-    session = requests.Session()
-    session.headers.update(HEADERS)
-    
-    url = f"{BASE_URL}/FFL.cfm?FID=Matrix.cfm&MatID=3&League={league_id}"
-    resp = session.get(url, timeout=10)
-    soup = BeautifulSoup(resp.text, 'html.parser')
+def get_power_matrix_probs(league_id, teams, pages=None):
+    """
+    Get the detailed Power Matrix records for win probability calculation:
+    {(home_team, away_team): (home_wins, home_losses, home_ties)}.
+    """
+    soup = BeautifulSoup(get_page(matrix_probs_url(league_id), pages), 'lxml', parse_only=_ROWS_STRAINER)
     
     # Find all rows
     all_rows = soup.find_all('tr')
@@ -406,12 +357,13 @@ def fetch_matrix_probs_for_matchups(league_id, matchups, teams):
     
     if not column_abbrevs:
         print(f"    Warning: Could not find column abbreviations for league {league_id}")
-        return {(m['away_team'], m['home_team']): {'away_win_pct': 0.5, 'home_win_pct': 0.5, 'home_record': 'N/A'} for m in matchups}
+        return {}
     
     # Parse data rows to extract team names and their records
     # The matrix has home teams as rows and away teams as columns
     row_data = []  # List of (team_name, [record_cells])
     matched_teams = set()  # Track which teams we've already matched
+    teams_set = frozenset(teams)
     
     for row in all_rows:
         cells = row.find_all(['td', 'th'])
@@ -420,12 +372,13 @@ def fetch_matrix_probs_for_matchups(league_id, matchups, teams):
         
         # First cell should contain team name
         first_cell = cells[0].get_text(strip=True)
-        first_cell_clean = first_cell.replace("`", "'").strip()
+        first_cell_clean = normalize_team_name(first_cell)
         
         # Check if this row has record patterns (indicates data row)
         has_records = False
         for cell in cells[1:min(6, len(cells))]:
-            if re.match(r'^\d+-\d+(-\d+)?$', cell.get_text(strip=True)):
+            text = cell.get_text(strip=True)
+            if '-' in text and _RECORD_RE.match(text):
                 has_records = True
                 break
         
@@ -434,15 +387,12 @@ def fetch_matrix_probs_for_matchups(league_id, matchups, teams):
         
         # Try to match with known team names
         matched_team = None
-        for team in teams:
-            if team in matched_teams:
-                continue
-            if team == first_cell_clean:
-                matched_team = team
-                break
+        if first_cell_clean in teams_set and first_cell_clean not in matched_teams:
+            matched_team = first_cell_clean
+        elif first_cell_clean and len(first_cell_clean) > 5:
             # Try partial match only if exact match didn't work
-            if first_cell_clean and len(first_cell_clean) > 5:
-                if team in first_cell_clean or first_cell_clean in team:
+            for team in teams:
+                if team not in matched_teams and (team in first_cell_clean or first_cell_clean in team):
                     matched_team = team
                     break
         
@@ -476,7 +426,7 @@ def fetch_matrix_probs_for_matchups(league_id, matchups, teams):
                 continue
             
             record_text = records[i]
-            match = re.match(r'^(\d+)-(\d+)(?:-(\d+))?$', record_text)
+            match = _RECORD_RE.match(record_text)
             
             if match:
                 wins = int(match.group(1))
@@ -484,6 +434,14 @@ def fetch_matrix_probs_for_matchups(league_id, matchups, teams):
                 ties = int(match.group(3)) if match.group(3) else 0
                 matrix[(home_team, away_team)] = (wins, losses, ties)
     
+    return matrix
+
+
+def fetch_matrix_probs_for_matchups(league_id, matchups, teams, pages=None):
+    """Fetch Power Matrix win probabilities for Week 14 matchups."""
+    # Unmatched games (or an unreadable matrix) default to a coin flip
+    matrix = get_power_matrix_probs(league_id, teams, pages)
+    
     # Calculate win probabilities for each matchup
     matchup_probs = {}
     
@@ -516,23 +474,36 @@ def fetch_matrix_probs_for_matchups(league_id, matchups, teams):
     return matchup_probs
 
 
+def fetch_league(league_name, league_info):
+    """Fetch one league's data plus its Week 14 win probabilities."""
+    league_id = league_info['id']
+    
+    # The pages don't depend on each other, so request them all up front
+    pages = fetch_pages([standings_url(league_id), schedule_url(league_id), matrix_probs_url(league_id)])
+    
+    # Fetch main data
+    data = fetch_league_data(league_name, league_id, pages)
+    data['has_relegation'] = league_info['has_relegation']
+    data['league_id'] = league_id
+    data['league_name'] = league_name
+    
+    # Fetch Power Matrix probabilities for matchups
+    print(f"  [{league_name}] Getting Power Matrix win probabilities...")
+    matchup_probs = fetch_matrix_probs_for_matchups(league_id, data['week14_matchups'], data['teams'], pages)
+    data['matchup_probs'] = {f"{away}__at__{home}": prob for (away, home), prob in matchup_probs.items()}
+    
+    return data
+
+
 def main():
     all_data = {}
     
-    for league_name, league_info in LEAGUES.items():
-        league_id = league_info['id']
-        
-        # Fetch main data
-        data = fetch_league_data(league_name, league_id)
-        data['has_relegation'] = league_info['has_relegation']
-        data['league_id'] = league_id
-        data['league_name'] = league_name
-        
-        # Fetch Power Matrix probabilities for matchups
-        print("  Getting Power Matrix win probabilities...")
-        matchup_probs = fetch_matrix_probs_for_matchups(league_id, data['week14_matchups'], data['teams'])
-        data['matchup_probs'] = {f"{away}__at__{home}": prob for (away, home), prob in matchup_probs.items()}
-        
+    # The leagues are independent and the work is waiting on the network, so
+    # fetch them on threads sharing SESSION's connection pool
+    with ThreadPoolExecutor(max_workers=len(LEAGUES)) as ex:
+        results = list(ex.map(fetch_league, LEAGUES, LEAGUES.values()))
+    
+    for league_name, data in zip(LEAGUES, results):
         all_data[league_name] = data
         
         div_summary = ', '.join([f"{k}={len(v)}" for k, v in sorted(data['divisions'].items())])
@@ -544,8 +515,8 @@ def main():
     
     # Save all data
     output_file = 'all_leagues_data.json'
-    with open(output_file, 'w') as f:
-        json.dump(all_data, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(all_data, option=orjson.OPT_INDENT_2, default=dict))
     
     print(f"\n{'='*60}")
     print(f"✅ All league data saved to {output_file}")
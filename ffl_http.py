@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+HTTP session setup shared by the scraping scripts.
+"""
+
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+}
+
+# Seconds a cached page stays fresh; every script shares the one cache file,
+# and requests-cache stores the expiry with each response, so it is set here once
+CACHE_EXPIRE_AFTER = 3600
+
+# One keep-alive connection pool for every page fetched from the site. Set
+# FFL_CACHE=1 while iterating on the parsers to serve repeat runs from the
+# on-disk cache (ffl_cache.sqlite) instead of the network.
+if os.environ.get('FFL_CACHE'):
+    import requests_cache
+    SESSION = requests_cache.CachedSession('ffl_cache', expire_after=CACHE_EXPIRE_AFTER)
+else:
+    SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+# Sized for fetch_all_leagues' pages in flight at once, with retries for
+# dropped connections
+SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=12, max_retries=Retry(total=3, backoff_factor=0.3)))
@@ -4,173 +4,68 @@ Get full game history for tiebreaker calculations.
 Need H2H records, division records, and points scored.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import re
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from ffl_http import SESSION
+from teams import ALL_TEAMS, DIVISIONS, get_team_division, normalize_team_name
 
 BASE_URL = "https://www.dougin.com/ffl"
 LEAGUE_ID = 3
 
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-}
-
-# All team names
-ALL_TEAMS = [
-    "Boomie's Boys",
-    "Mobius Strippers",
-    "Los Pollos Hermanos",
-    "The ReBiggulators",
-    "The Original Series",
-    "Hampden Has-Beens",
-    "Free The Nip",
-    "One Direction Two",
-    "Lester Pearls",
-    "Gashouse Gorillas",
-    "East Shore Boys",
-    "Ytterby Yetis",
-]
+TEAM_IDX = {team: i for i, team in enumerate(ALL_TEAMS)}
 
-# Divisions
-DIVISIONS = {
-    'O': ["Boomie's Boys", "Mobius Strippers", "Hampden Has-Beens", "One Direction Two"],
-    'W': ["Los Pollos Hermanos", "The ReBiggulators", "Gashouse Gorillas", "Ytterby Yetis"],
-    'D': ["The Original Series", "Free The Nip", "Lester Pearls", "East Shore Boys"],
-}
+# Patterns used while parsing the schedule and matrix pages
+# Played games, one per line of newline-joined link texts
+_PLAYED_LINE_RE = re.compile(r'^(.+?)[^\S\n]*\((\d+)\)[^\S\n]*at[^\S\n]*(.+?)[^\S\n]*\((\d+)\)', re.MULTILINE)
+_WS_RE = re.compile(r'\s+')
+_WEEK14_RE = re.compile(r'Week 14\s*(.*?)(?:Playoffs?|Championship|I\'m a dialog|$)', re.IGNORECASE)
+_WEEK14_HEADER_RE = re.compile(r'Week\s+14', re.IGNORECASE)
+_AT_RE = re.compile(r'\s+at\s+')
+_RANK_RE = re.compile(r'^\d+\.$')
 
-def get_team_division(team):
-    """Get the division for a team."""
-    for div, teams in DIVISIONS.items():
-        if team in teams:
-            return div
-    return None
+# Any team name ending the text before " at " / starting the text after it,
+# one branch per team in ALL_TEAMS order so the earliest team still wins;
+# the site writes apostrophes as backticks
+_TEAM_PATTERNS = [team.replace("'", "[`']") for team in ALL_TEAMS]
+_AWAY_TEAM_RE = re.compile(
+    '|'.join(rf'.*?(?P<t{i}>{pattern})$' for i, pattern in enumerate(_TEAM_PATTERNS)),
+    re.IGNORECASE | re.DOTALL,
+)
+_HOME_TEAM_RE = re.compile(
+    '|'.join(rf'(?P<t{i}>{pattern})' for i, pattern in enumerate(_TEAM_PATTERNS)),
+    re.IGNORECASE,
+)
 
-def normalize_team_name(name):
-    """Normalize team name."""
-    name = name.strip().replace('`', "'")
-    
-    # Partial matches
-    name_lower = name.lower()
-    if 'boomie' in name_lower:
-        return "Boomie's Boys"
-    if 'mobius' in name_lower:
-        return "Mobius Strippers"
-    if 'pollos' in name_lower:
-        return "Los Pollos Hermanos"
-    if 'rebiggulator' in name_lower:
-        return "The ReBiggulators"
-    if 'original' in name_lower:
-        return "The Original Series"
-    if 'hampden' in name_lower:
-        return "Hampden Has-Beens"
-    if 'nip' in name_lower:
-        return "Free The Nip"
-    if 'direction' in name_lower:
-        return "One Direction Two"
-    if 'lester' in name_lower or 'pearl' in name_lower:
-        return "Lester Pearls"
-    if 'gashouse' in name_lower or 'gorilla' in name_lower:
-        return "Gashouse Gorillas"
-    if 'east shore' in name_lower or 'shore boy' in name_lower:
-        return "East Shore Boys"
-    if 'ytterby' in name_lower or 'yeti' in name_lower:
-        return "Ytterby Yetis"
-    
-    return name
-
-def parse_schedule():
-    """Parse all games from the schedule."""
-    session = requests.Session()
-    session.headers.update(HEADERS)
-    
-    url = f"{BASE_URL}/FFL.cfm?FID=LeagueSchedule.cfm&League={LEAGUE_ID}"
-    resp = session.get(url, timeout=10)
-    soup = BeautifulSoup(resp.text, 'html.parser')
-    
-    all_games = []
-    week14_matchups = []
-    
-    # Find all game links with scores - they contain the game info
-    game_links = soup.find_all('a', class_='base_link2')
-    
-    for link in game_links:
-        game_text = link.get_text(strip=True)
-        
-        # Pattern for played games: "Team1 (score1) at Team2 (score2)"
-        played_match = re.match(r'(.+?)\s*\((\d+)\)\s*at\s*(.+?)\s*\((\d+)\)', game_text)
-        
-        if played_match:
-            away_team = normalize_team_name(played_match.group(1))
-            away_score = int(played_match.group(2))
-            home_team = normalize_team_name(played_match.group(3))
-            home_score = int(played_match.group(4))
-            
-            if away_team in ALL_TEAMS and home_team in ALL_TEAMS:
-                game = {
-                    'away_team': away_team,
-                    'away_score': away_score,
-                    'home_team': home_team,
-                    'home_score': home_score,
-                    'played': True,
-                }
-                
-                # Determine winner
-                if away_score > home_score:
-                    game['winner'] = away_team
-                    game['loser'] = home_team
-                elif home_score > away_score:
-                    game['winner'] = home_team
-                    game['loser'] = away_team
-                else:
-                    game['winner'] = None  # Tie
-                    game['loser'] = None
-                
-                # Is this a division game?
-                away_div = get_team_division(away_team)
-                home_div = get_team_division(home_team)
-                game['is_division_game'] = (away_div == home_div)
-                
-                all_games.append(game)
-    
-    # Assign weeks - games are listed in order, 6 per week
-    for i, game in enumerate(all_games):
-        game['week'] = (i // 6) + 1
-    
-    # Now parse Week 14 matchups (unplayed games)
-    # They're in the schedule text without scores
-    text = soup.get_text()
-    text_clean = re.sub(r'\s+', ' ', text)
+def _parse_week14_matchups(text):
+    """Pair up the unscored "Team1 at Team2" games after the Week 14 header."""
+    text_clean = _WS_RE.sub(' ', text)
+    matchups = []
     
     # Find Week 14 section
-    week14_match = re.search(r'Week 14\s*(.*?)(?:Playoffs?|Championship|I\'m a dialog|$)', text_clean, re.IGNORECASE)
+    week14_match = _WEEK14_RE.search(text_clean)
     
     if week14_match:
         week14_text = week14_match.group(1)
         
         # Parse unplayed games: "Team1 at Team2 Team3 at Team4..."
         # Split on " at " and pair teams
-        parts = re.split(r'\s+at\s+', week14_text)
+        parts = _AT_RE.split(week14_text)
         
         for i in range(len(parts) - 1):
             away_raw = parts[i].strip()
             home_raw = parts[i + 1].strip()
             
             # Find the last team name in away_raw
-            away_team = None
-            for team in ALL_TEAMS:
-                team_pattern = team.replace("'", "[`']")
-                if re.search(rf'{team_pattern}$', away_raw, re.IGNORECASE):
-                    away_team = team
-                    break
+            away_match = _AWAY_TEAM_RE.match(away_raw)
+            away_team = ALL_TEAMS[int(away_match.lastgroup[1:])] if away_match else None
             
             # Find the first team name in home_raw
-            home_team = None
-            for team in ALL_TEAMS:
-                team_pattern = team.replace("'", "[`']")
-                if re.search(rf'^{team_pattern}', home_raw, re.IGNORECASE):
-                    home_team = team
-                    break
+            home_match = _HOME_TEAM_RE.match(home_raw)
+            home_team = ALL_TEAMS[int(home_match.lastgroup[1:])] if home_match else None
             
             if away_team and home_team:
                 matchup = {
@@ -184,105 +79,170 @@ def parse_schedule():
                     'loser': None,
                     'is_division_game': get_team_division(away_team) == get_team_division(home_team),
                 }
-                week14_matchups.append(matchup)
+                matchups.append(matchup)
+    
+    return matchups
+
+def parse_schedule():
+    """Parse all games from the schedule."""
+    url = f"{BASE_URL}/FFL.cfm?FID=LeagueSchedule.cfm&League={LEAGUE_ID}"
+    resp = SESSION.get(url, timeout=10)
+    soup = BeautifulSoup(resp.text, 'lxml')
+    
+    all_games = []
+    week14_matchups = []
+    
+    # Find all game links with scores - they contain the game info
+    game_links = soup.find_all('a', class_='base_link2')
+    
+    # One line per link (whitespace inside a link collapsed, so a newline in
+    # its text can't split the game), then a single pass of the played-game
+    # pattern ("Team1 (score1) at Team2 (score2)") over all of them
+    link_text = '\n'.join(_WS_RE.sub(' ', link.get_text(strip=True)) for link in game_links)
+    
+    for played_match in _PLAYED_LINE_RE.finditer(link_text):
+        away_team = normalize_team_name(played_match.group(1))
+        away_score = int(played_match.group(2))
+        home_team = normalize_team_name(played_match.group(3))
+        home_score = int(played_match.group(4))
+        
+        if away_team in ALL_TEAMS and home_team in ALL_TEAMS:
+            game = {
+                'away_team': away_team,
+                'away_score': away_score,
+                'home_team': home_team,
+                'home_score': home_score,
+                'played': True,
+            }
+            
+            # Determine winner
+            if away_score > home_score:
+                game['winner'] = away_team
+                game['loser'] = home_team
+            elif home_score > away_score:
+                game['winner'] = home_team
+                game['loser'] = away_team
+            else:
+                game['winner'] = None  # Tie
+                game['loser'] = None
+            
+            # Is this a division game?
+            away_div = get_team_division(away_team)
+            home_div = get_team_division(home_team)
+            game['is_division_game'] = (away_div == home_div)
+            
+            all_games.append(game)
+    
+    # Assign weeks - games are listed in order, 6 per week
+    for i, game in enumerate(all_games):
+        game['week'] = (i // 6) + 1
+    
+    # Now parse Week 14 matchups (unplayed games)
+    # They're in the schedule text without scores. Only the table under the
+    # Week 14 header needs flattening; fall back to the whole page if that
+    # turns up nothing
+    week14_header = soup.find(string=_WEEK14_HEADER_RE)
+    week14_table = week14_header.find_parent('table') if week14_header is not None else None
+    if week14_table is not None:
+        week14_matchups = _parse_week14_matchups(week14_table.get_text())
+    if not week14_matchups:
+        week14_matchups = _parse_week14_matchups(soup.get_text())
     
     return all_games, week14_matchups
 
+def _count_pairs(rows, cols, weights=None):
+    """
+    Count (row team, col team) occurrences, or sum their weights, into a
+    team-by-team matrix with a single bincount over the flattened pair index.
+    """
+    n = len(ALL_TEAMS)
+    counts = np.bincount(rows * n + cols, weights=weights, minlength=n * n)
+    return counts.reshape(n, n).astype(int)
+
 def calculate_team_stats(games):
     """Calculate all stats needed for tiebreakers."""
     
     # Only use played games
     played_games = [g for g in games if g['played']]
     
-    # Initialize stats for each team
+    # One entry per game, teams as indexes into ALL_TEAMS
+    away = np.array([TEAM_IDX[g['away_team']] for g in played_games], dtype=int)
+    home = np.array([TEAM_IDX[g['home_team']] for g in played_games], dtype=int)
+    away_score = np.array([g['away_score'] for g in played_games], dtype=int)
+    home_score = np.array([g['home_score'] for g in played_games], dtype=int)
+    is_div = np.array([g['is_division_game'] for g in played_games], dtype=bool)
+    away_won = away_score > home_score
+    home_won = home_score > away_score
+    tied = ~(away_won | home_won)
+    
+    # H2H points: [team, opp] is what team scored against opp
+    h2h_points = _count_pairs(away, home, away_score) + _count_pairs(home, away, home_score)
+    
+    # H2H wins and ties: [team, opp] counts team's wins (ties) against opp,
+    # so the transpose of the wins holds the losses
+    h2h_wins = (_count_pairs(away[away_won], home[away_won])
+                + _count_pairs(home[home_won], away[home_won]))
+    h2h_ties = (_count_pairs(away[tied], home[tied])
+                + _count_pairs(home[tied], away[tied]))
+    div_wins = (_count_pairs(away[away_won & is_div], home[away_won & is_div])
+                + _count_pairs(home[home_won & is_div], away[home_won & is_div]))
+    div_ties = (_count_pairs(away[tied & is_div], home[tied & is_div])
+                + _count_pairs(home[tied & is_div], away[tied & is_div]))
+    
+    wins = h2h_wins.sum(axis=1).tolist()
+    losses = h2h_wins.sum(axis=0).tolist()
+    ties = h2h_ties.sum(axis=1).tolist()
+    points_for = h2h_points.sum(axis=1).tolist()
+    points_against = h2h_points.sum(axis=0).tolist()
+    division_wins = div_wins.sum(axis=1).tolist()
+    division_losses = div_wins.sum(axis=0).tolist()
+    division_ties = div_ties.sum(axis=1).tolist()
+    h2h_wins = h2h_wins.tolist()
+    h2h_ties = h2h_ties.tolist()
+    h2h_points = h2h_points.tolist()
+    
+    # Back to the per-team dicts the rest of the script and the JSON expect
     stats = {}
-    for team in ALL_TEAMS:
+    for i, team in enumerate(ALL_TEAMS):
         stats[team] = {
             'team': team,
             'division': get_team_division(team),
-            'wins': 0,
-            'losses': 0,
-            'ties': 0,
-            'points_for': 0,
-            'points_against': 0,
-            'division_wins': 0,
-            'division_losses': 0,
-            'division_ties': 0,
+            'wins': wins[i],
+            'losses': losses[i],
+            'ties': ties[i],
+            'points_for': points_for[i],
+            'points_against': points_against[i],
+            'division_wins': division_wins[i],
+            'division_losses': division_losses[i],
+            'division_ties': division_ties[i],
             'h2h': {},  # Head-to-head vs each opponent
             'games_played': [],
         }
-        # Initialize H2H against each other team
-        for opp in ALL_TEAMS:
+        for j, opp in enumerate(ALL_TEAMS):
             if opp != team:
                 stats[team]['h2h'][opp] = {
-                    'wins': 0,
-                    'losses': 0,
-                    'ties': 0,
-                    'points_for': 0,
-                    'points_against': 0,
+                    'wins': h2h_wins[i][j],
+                    'losses': h2h_wins[j][i],
+                    'ties': h2h_ties[i][j],
+                    'points_for': h2h_points[i][j],
+                    'points_against': h2h_points[j][i],
                 }
     
-    # Process each played game
+    # Track games
     for game in played_games:
-        away = game['away_team']
-        home = game['home_team']
-        away_score = game['away_score']
-        home_score = game['home_score']
-        is_div = game['is_division_game']
-        
-        # Track games
-        stats[away]['games_played'].append(game)
-        stats[home]['games_played'].append(game)
-        
-        # Update points
-        stats[away]['points_for'] += away_score
-        stats[away]['points_against'] += home_score
-        stats[home]['points_for'] += home_score
-        stats[home]['points_against'] += away_score
-        
-        # Update H2H points
-        stats[away]['h2h'][home]['points_for'] += away_score
-        stats[away]['h2h'][home]['points_against'] += home_score
-        stats[home]['h2h'][away]['points_for'] += home_score
-        stats[home]['h2h'][away]['points_against'] += away_score
-        
-        # Update W/L
-        if away_score > home_score:
-            stats[away]['wins'] += 1
-            stats[home]['losses'] += 1
-            stats[away]['h2h'][home]['wins'] += 1
-            stats[home]['h2h'][away]['losses'] += 1
-            if is_div:
-                stats[away]['division_wins'] += 1
-                stats[home]['division_losses'] += 1
-        elif home_score > away_score:
-            stats[home]['wins'] += 1
-            stats[away]['losses'] += 1
-            stats[home]['h2h'][away]['wins'] += 1
-            stats[away]['h2h'][home]['losses'] += 1
-            if is_div:
-                stats[home]['division_wins'] += 1
-                stats[away]['division_losses'] += 1
-        else:
-            stats[away]['ties'] += 1
-            stats[home]['ties'] += 1
-            stats[away]['h2h'][home]['ties'] += 1
-            stats[home]['h2h'][away]['ties'] += 1
-            if is_div:
-                stats[away]['division_ties'] += 1
-                stats[home]['division_ties'] += 1
+        stats[game['away_team']]['games_played'].append(game)
+        stats[game['home_team']]['games_played'].append(game)
     
     return stats
 
 def get_matrix_rank(session=None):
     """Get matrix rank for each team from Power Matrix page."""
     if session is None:
-        session = requests.Session()
-        session.headers.update(HEADERS)
+        session = SESSION
     
     url = f"{BASE_URL}/FFL.cfm?Matrix=1&League={LEAGUE_ID}"
     resp = session.get(url, timeout=10)
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    soup = BeautifulSoup(resp.text, 'lxml')
     
     matrix_ranks = {}
     
@@ -295,7 +255,7 @@ def get_matrix_rank(session=None):
             
             if len(cell_texts) >= 3:
                 first = cell_texts[0]
-                if re.match(r'^\d+\.$', first):
+                if _RANK_RE.match(first):
                     rank = int(first.replace('.', ''))
                     team = normalize_team_name(cell_texts[2])
                     if team in ALL_TEAMS and team not in matrix_ranks:
@@ -308,7 +268,12 @@ def main():
     print("Extracting Full Game History for Tiebreakers")
     print("=" * 60)
     
-    played_games, week14_matchups = parse_schedule()
+    # The schedule and the Power Matrix pages are independent; fetch both at once
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        schedule_future = executor.submit(parse_schedule)
+        ranks_future = executor.submit(get_matrix_rank, SESSION)
+        played_games, week14_matchups = schedule_future.result()
+        matrix_ranks = ranks_future.result()
     
     print(f"\nPlayed games (Weeks 1-13): {len(played_games)}")
     print(f"Week 14 matchups: {len(week14_matchups)}")
@@ -331,11 +296,6 @@ def main():
     # Calculate stats
     stats = calculate_team_stats(played_games)
     
-    # Get matrix ranks
-    session = requests.Session()
-    session.headers.update(HEADERS)
-    matrix_ranks = get_matrix_rank(session)
-    
     # Add matrix rank to stats
     for team in stats:
         stats[team]['matrix_rank'] = matrix_ranks.get(team, 99)
@@ -366,8 +326,8 @@ def main():
         'week14_matchups': week14_matchups,
     }
     
-    with open('full_history.json', 'w') as f:
-        json.dump(data, f, indent=2)
+    with open('full_history.json', 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     
     print("\n✅ Full history saved to full_history.json")
     
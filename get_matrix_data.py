@@ -6,64 +6,19 @@ The Power Matrix shows hypothetical outcomes if every team played every other te
 We can use this to calculate win probabilities for Week 14 matchups.
 """
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
-import json
+import orjson
+import numpy as np
+
+from ffl_http import SESSION
+from teams import ALL_TEAMS, normalize_team_name
 
 BASE_URL = "https://www.dougin.com/ffl"
 LEAGUE_ID = 3
 
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-}
-
-ALL_TEAMS = [
-    "Boomie's Boys",
-    "Mobius Strippers",
-    "Los Pollos Hermanos",
-    "The ReBiggulators",
-    "The Original Series",
-    "Hampden Has-Beens",
-    "Free The Nip",
-    "One Direction Two",
-    "Lester Pearls",
-    "Gashouse Gorillas",
-    "East Shore Boys",
-    "Ytterby Yetis",
-]
-
-def normalize_team_name(name):
-    """Normalize team name."""
-    name = name.strip().replace('`', "'")
-    
-    name_lower = name.lower()
-    if 'boomie' in name_lower:
-        return "Boomie's Boys"
-    if 'mobius' in name_lower:
-        return "Mobius Strippers"
-    if 'pollos' in name_lower:
-        return "Los Pollos Hermanos"
-    if 'rebiggulator' in name_lower:
-        return "The ReBiggulators"
-    if 'original' in name_lower:
-        return "The Original Series"
-    if 'hampden' in name_lower:
-        return "Hampden Has-Beens"
-    if 'nip' in name_lower:
-        return "Free The Nip"
-    if 'direction' in name_lower:
-        return "One Direction Two"
-    if 'lester' in name_lower or 'pearl' in name_lower:
-        return "Lester Pearls"
-    if 'gashouse' in name_lower or 'gorilla' in name_lower:
-        return "Gashouse Gorillas"
-    if 'east shore' in name_lower or 'shore boy' in name_lower:
-        return "East Shore Boys"
-    if 'ytterby' in name_lower or 'yeti' in name_lower:
-        return "Ytterby Yetis"
-    
-    return name
+# "Team1 (score1) at Team2 (score2)"
+_PLAYED_RE = re.compile(r'(.+?)\s*\((\d+)\)\s*at\s*(.+?)\s*\((\d+)\)')
 
 
 def get_weekly_scores():
@@ -71,12 +26,11 @@ def get_weekly_scores():
     Get each team's score for each week from the schedule.
     Returns dict: {team: {week: score}}
     """
-    session = requests.Session()
-    session.headers.update(HEADERS)
-    
     url = f"{BASE_URL}/FFL.cfm?FID=LeagueSchedule.cfm&League={LEAGUE_ID}"
-    resp = session.get(url, timeout=10)
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    resp = SESSION.get(url, timeout=10)
+    # Only the game links are read, so build nothing but anchors; the class
+    # filter stays on find_all, which matches multi-class attributes
+    soup = BeautifulSoup(resp.text, 'lxml', parse_only=SoupStrainer('a'))
     
     # Find all game links with scores
     game_links = soup.find_all('a', class_='base_link2')
@@ -88,7 +42,7 @@ def get_weekly_scores():
         game_text = link.get_text(strip=True)
         
         # Pattern for played games: "Team1 (score1) at Team2 (score2)"
-        played_match = re.match(r'(.+?)\s*\((\d+)\)\s*at\s*(.+?)\s*\((\d+)\)', game_text)
+        played_match = _PLAYED_RE.match(game_text)
         
         if played_match:
             away_team = normalize_team_name(played_match.group(1))
@@ -114,34 +68,30 @@ def calculate_matrix_records(weekly_scores):
     For each week, compare every team's score against every other team.
     Returns dict: {(team1, team2): {'wins': X, 'losses': Y, 'ties': Z}}
     """
+    # Scores as a team x week array (weeks 1-13), NaN where a team has none
+    weeks = range(1, 14)
+    scores = np.array([[weekly_scores[team].get(week, np.nan) for week in weeks] for team in ALL_TEAMS], dtype=float)
+    
+    # diff[i, j, w] compares team i with team j in week w; only weeks where
+    # both teams have a score count
+    diff = scores[:, None, :] - scores[None, :, :]
+    valid = ~np.isnan(diff)
+    wins = ((diff > 0) & valid).sum(axis=-1).tolist()
+    losses = ((diff < 0) & valid).sum(axis=-1).tolist()
+    ties = ((diff == 0) & valid).sum(axis=-1).tolist()
+    
     matrix = {}
     
-    for team1 in ALL_TEAMS:
-        for team2 in ALL_TEAMS:
+    for i, team1 in enumerate(ALL_TEAMS):
+        for j, team2 in enumerate(ALL_TEAMS):
             if team1 != team2:
-                wins = 0
-                losses = 0
-                ties = 0
-                
-                # Compare scores for each week both teams have scores
-                for week in range(1, 14):
-                    if week in weekly_scores[team1] and week in weekly_scores[team2]:
-                        score1 = weekly_scores[team1][week]
-                        score2 = weekly_scores[team2][week]
-                        
-                        if score1 > score2:
-                            wins += 1
-                        elif score2 > score1:
-                            losses += 1
-                        else:
-                            ties += 1
-                
+                total = wins[i][j] + losses[i][j] + ties[i][j]
                 matrix[(team1, team2)] = {
-                    'wins': wins,
-                    'losses': losses,
-                    'ties': ties,
-                    'total': wins + losses + ties,
-                    'win_pct': wins / (wins + losses + ties) if (wins + losses + ties) > 0 else 0.5
+                    'wins': wins[i][j],
+                    'losses': losses[i][j],
+                    'ties': ties[i][j],
+                    'total': total,
+                    'win_pct': wins[i][j] / total if total > 0 else 0.5
                 }
     
     return matrix
@@ -192,8 +142,9 @@ def main():
         'matrix': matrix_json,
     }
     
-    with open('matrix_data.json', 'w') as f:
-        json.dump(output, f, indent=2)
+    # Week numbers key the weekly scores, hence OPT_NON_STR_KEYS
+    with open('matrix_data.json', 'wb') as f:
+        f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     
     print("\n✅ Matrix data saved to matrix_data.json")
 
@@ -3,21 +3,42 @@
 Get raw schedule HTML to debug parsing.
 """
 
-import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 import re
 
-BASE_URL = "https://www.dougin.com/ffl"
+from ffl_http import SESSION
 
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-}
 
-session = requests.Session()
-session.headers.update(HEADERS)
+class PageText:
+    """
+    lxml parser target that keeps a page's text, skipping scripts, styles
+    and templates as get_text() does.
+    """
+    
+    def __init__(self):
+        self.parts = []
+        self.skipping = 0
+    
+    def start(self, tag, attrib):
+        if tag in ('script', 'style', 'template'):
+            self.skipping += 1
+    
+    def end(self, tag):
+        if tag in ('script', 'style', 'template'):
+            self.skipping -= 1
+    
+    def data(self, data):
+        if not self.skipping:
+            self.parts.append(data)
+    
+    def close(self):
+        return ''.join(self.parts)
+
+
+BASE_URL = "https://www.dougin.com/ffl"
 
 url = f"{BASE_URL}/FFL.cfm?FID=LeagueSchedule.cfm&League=3"
-resp = session.get(url, timeout=10)
+resp = SESSION.get(url, timeout=10)
 
 # Save raw HTML
 with open('schedule_raw.html', 'w') as f:
@@ -25,11 +46,13 @@ with open('schedule_raw.html', 'w') as f:
 
 print("Saved raw HTML to schedule_raw.html")
 
-# Parse and look for Week 14 specifically
-soup = BeautifulSoup(resp.text, 'html.parser')
+# Feed the whole page to a target that only collects text, so no tree is
+# built; only the Week 14 substring is wanted
+parser = etree.HTMLParser(target=PageText())
+parser.feed(resp.text)
 
 # Get text and look for unplayed games (no scores)
-text = soup.get_text()
+text = parser.close()
 text = re.sub(r'\s+', ' ', text)
 
 # Find Week 14 section specifically
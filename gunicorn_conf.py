@@ -0,0 +1,21 @@
+"""Gunicorn settings for serving app:app (gunicorn -c gunicorn_conf.py app:app)."""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# WEB_CONCURRENCY lets the host cap workers to its memory; otherwise scale with cores
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = 4
+
+# Load the app once in the master so its caches are shared copy-on-write by
+# every worker instead of rebuilt per worker
+preload_app = True
+
+
+def when_ready(server):
+    """Warm the summary caches in the preloaded master, before workers fork."""
+    from app import warm_caches
+    warm_caches()
@@ -11,12 +11,20 @@ This module implements:
 import json
 import numpy as np
 from collections import defaultdict
-import copy
 
 # Load league data
 with open('all_leagues_data.json') as f:
     ALL_LEAGUES = json.load(f)
 
+# The tiebreakers in app index h2h directly, so every pair needs an entry
+for _league in ALL_LEAGUES.values():
+    for _team in _league['teams']:
+        for _opp in _league['teams']:
+            if _opp != _team:
+                _league['stats'][_team]['h2h'].setdefault(
+                    _opp, {'wins': 0, 'losses': 0, 'ties': 0, 'points_for': 0, 'points_against': 0}
+                )
+
 
 def calculate_home_away_advantage(league_name):
     """
@@ -205,11 +213,21 @@ def calculate_win_pct(wins, losses, ties=0):
     return (wins + 0.5 * ties) / total
 
 
+def _clone_stats(stats):
+    """Copy {team: {field: number, 'h2h': {opp: {field: number}}}} without deepcopy's memo walk."""
+    cloned = {}
+    for team, team_stats in stats.items():
+        row = dict(team_stats)
+        row['h2h'] = {opp: dict(h2h) for opp, h2h in team_stats['h2h'].items()}
+        cloned[team] = row
+    return cloned
+
+
 def apply_simulation_results(base_stats, game_results, divisions):
     """
     Apply simulated game results to create updated stats.
     """
-    new_stats = copy.deepcopy(base_stats)
+    new_stats = _clone_stats(base_stats)
     
     for game in game_results:
         away = game['away_team']
@@ -218,16 +236,6 @@ def apply_simulation_results(base_stats, game_results, divisions):
         away_score = game['away_score']
         home_score = game['home_score']
         
-        # Ensure h2h dicts exist
-        if 'h2h' not in new_stats[away]:
-            new_stats[away]['h2h'] = {}
-        if 'h2h' not in new_stats[home]:
-            new_stats[home]['h2h'] = {}
-        if home not in new_stats[away]['h2h']:
-            new_stats[away]['h2h'][home] = {'wins': 0, 'losses': 0, 'ties': 0, 'points_for': 0, 'points_against': 0}
-        if away not in new_stats[home]['h2h']:
-            new_stats[home]['h2h'][away] = {'wins': 0, 'losses': 0, 'ties': 0, 'points_for': 0, 'points_against': 0}
-        
         # Update points for/against
         new_stats[away]['points_for'] = new_stats[away].get('points_for', 0) + away_score
         new_stats[home]['points_for'] = new_stats[home].get('points_for', 0) + home_score
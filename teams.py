@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+FFPL team names, divisions and team-name normalization shared by the
+scraping scripts.
+"""
+
+import re
+from functools import lru_cache
+
+# All team names
+ALL_TEAMS = [
+    "Boomie's Boys",
+    "Mobius Strippers",
+    "Los Pollos Hermanos",
+    "The ReBiggulators",
+    "The Original Series",
+    "Hampden Has-Beens",
+    "Free The Nip",
+    "One Direction Two",
+    "Lester Pearls",
+    "Gashouse Gorillas",
+    "East Shore Boys",
+    "Ytterby Yetis",
+]
+
+# Divisions
+DIVISIONS = {
+    'O': ["Boomie's Boys", "Mobius Strippers", "Hampden Has-Beens", "One Direction Two"],
+    'W': ["Los Pollos Hermanos", "The ReBiggulators", "Gashouse Gorillas", "Ytterby Yetis"],
+    'D': ["The Original Series", "Free The Nip", "Lester Pearls", "East Shore Boys"],
+}
+
+def get_team_division(team):
+    """Get the division for a team."""
+    for div, teams in DIVISIONS.items():
+        if team in teams:
+            return div
+    return None
+
+# Lowercase fragments that identify each team, in priority order
+_TEAM_KEYWORDS = [
+    ('boomie', "Boomie's Boys"),
+    ('mobius', "Mobius Strippers"),
+    ('pollos', "Los Pollos Hermanos"),
+    ('rebiggulator', "The ReBiggulators"),
+    ('original', "The Original Series"),
+    ('hampden', "Hampden Has-Beens"),
+    ('nip', "Free The Nip"),
+    ('direction', "One Direction Two"),
+    ('lester', "Lester Pearls"),
+    ('pearl', "Lester Pearls"),
+    ('gashouse', "Gashouse Gorillas"),
+    ('gorilla', "Gashouse Gorillas"),
+    ('east shore', "East Shore Boys"),
+    ('shore boy', "East Shore Boys"),
+    ('ytterby', "Ytterby Yetis"),
+    ('yeti', "Ytterby Yetis"),
+]
+# One anchored alternation: each branch searches the whole name for its
+# keyword before the next branch is tried, so list order decides ties
+_TEAM_KEYWORD_RE = re.compile(
+    '|'.join(rf'.*?(?P<t{i}>{re.escape(keyword)})' for i, (keyword, _) in enumerate(_TEAM_KEYWORDS)),
+    re.DOTALL,
+)
+
+@lru_cache(maxsize=None)
+def normalize_team_name(name):
+    """Normalize team name."""
+    name = name.strip().replace('`', "'")
+    
+    # Partial matches; the first keyword in _TEAM_KEYWORDS found anywhere wins
+    match = _TEAM_KEYWORD_RE.match(name.lower())
+    if match:
+        return _TEAM_KEYWORDS[int(match.lastgroup[1:])][1]
+    
+    return name